@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 from ..client.fuzzer_client import MCPFuzzerClient
-from ..fuzz_engine.corpus import build_corpus_root, build_target_id, default_fs_root
+from ..fuzz_engine.corpus import build_corpus_root, build_target_id
 from ..orchestrator.models import SessionContext
 from ..reports import FuzzerReporter
 from ..safety_system.safety import SafetyFilter
@@ -16,7 +16,7 @@ from ..transport.bootstrap import TransportBuildRequest, build_driver_with_auth
 from .session_settings import SessionSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionBundle:
     """Wired components for a single fuzz session."""
 
@@ -49,13 +49,16 @@ class SessionBootstrap:
         )
 
     def build(self) -> SessionBundle:
-        config = self._settings.config
+        settings = self._settings
+        config = settings.config
+        safety_enabled = settings.safety_enabled
+        output_dir = settings.output_dir
+        fs_root = config.get("fs_root")
         transport = build_driver_with_auth(self.build_transport_request(config))
 
         safety_system = None
-        if self._settings.safety_enabled:
+        if safety_enabled:
             safety_system = SafetyFilter()
-            fs_root = config.get("fs_root")
             if fs_root:
                 try:
                     safety_system.set_fs_root(fs_root)
@@ -65,26 +68,23 @@ class SessionBootstrap:
                     )
 
         reporter = None
-        if self._settings.output_dir is not None:
+        if output_dir is not None:
             reporter = FuzzerReporter(
-                output_dir=self._settings.output_dir, safety_system=safety_system
+                output_dir=output_dir, safety_system=safety_system
             )
 
         corpus_root = None
         if config.get("corpus_enabled", True):
-            target_id = build_target_id(
-                self._settings.protocol, self._settings.endpoint
-            )
-            fs_root = config.get("fs_root") or str(default_fs_root())
+            target_id = build_target_id(settings.protocol, settings.endpoint)
             corpus_root = str(build_corpus_root(fs_root, target_id))
 
         client = MCPFuzzerClient(
             transport=transport,
-            auth_manager=self._settings.auth_manager,
+            auth_manager=settings.auth_manager,
             tool_timeout=config.get("tool_timeout"),
             reporter=reporter,
             safety_system=safety_system,
-            safety_enabled=self._settings.safety_enabled,
+            safety_enabled=safety_enabled,
             max_concurrency=config.get("max_concurrency", 5),
             corpus_root=corpus_root,
             havoc_mode=config.get("havoc_mode", False),
@@ -104,7 +104,7 @@ class SessionBootstrap:
             client=client,
             config=config,
             reporter=reporter,
-            protocol_phase=self._settings.protocol_phase,
+            protocol_phase=settings.protocol_phase,
         )
         return SessionBundle(
             transport=transport,
@@ -8,41 +8,27 @@ from typing import Any
 from ..config import config_mediator
 
 
+# (``output`` section key, argparse attribute) pairs.
+_OUTPUT_SECTION_TO_ARGS: tuple[tuple[str, str], ...] = (
+    ("directory", "output_dir"),
+    ("format", "output_format"),
+    ("compress", "output_compress"),
+    ("types", "output_types"),
+    ("schema", "output_schema"),
+)
+
+
 def apply_nested_config_to_args(args: argparse.Namespace, defaults_parser) -> None:
     """Map nested ``output`` and ``auth`` sections onto argparse fields."""
     output_section = config_mediator.get("output")
     if isinstance(output_section, dict):
-        _apply_if_default(
-            args,
-            defaults_parser,
-            "output_dir",
-            output_section.get("directory"),
-        )
-        _apply_if_default(
-            args,
-            defaults_parser,
-            "output_format",
-            output_section.get("format"),
-        )
-        _apply_if_default(
-            args,
-            defaults_parser,
-            "output_compress",
-            output_section.get("compress"),
-        )
-        if output_section.get("types") is not None:
+        for section_key, args_key in _OUTPUT_SECTION_TO_ARGS:
             _apply_if_default(
                 args,
                 defaults_parser,
-                "output_types",
-                output_section.get("types"),
+                args_key,
+                output_section.get(section_key),
             )
-        _apply_if_default(
-            args,
-            defaults_parser,
-            "output_schema",
-            output_section.get("schema"),
-        )
 
 
 def _apply_if_default(
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CliConfig:
     """Holds parsed args plus merged configuration."""
 
@@ -19,7 +19,7 @@ class CliConfig:
         return SessionSettings(self.merged)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSettings:
     """Wraps the merged config dict with typed property accessors."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import Any
+from typing import Any, Callable
 
 from rich.console import Console
 
@@ -17,6 +17,26 @@ from ..config.env import ENVIRONMENT_VARIABLES, ValidationType
 from ..icons import CHECK, CROSS
 
 
+_BOOLEAN_ENV_VALUES = frozenset({"true", "false", "1", "0", "yes", "no", "on", "off"})
+
+
+def _is_numeric(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+# Built once at import so env checks only pay for a dict lookup per variable.
+_ENV_VALIDATORS: dict[ValidationType, Callable[[str, dict], bool]] = {
+    ValidationType.CHOICE: lambda value, params: value in params.get("choices", []),
+    ValidationType.BOOLEAN: lambda value, _params: value.lower() in _BOOLEAN_ENV_VALUES,
+    ValidationType.NUMERIC: lambda value, _params: _is_numeric(value),
+    ValidationType.STRING: lambda _value, _params: True,
+}
+
+
 class ValidationManager:
     """Unified validation system for CLI arguments and environment checks."""
 
@@ -199,29 +219,10 @@ class ValidationManager:
         self, value: str, validation_type: ValidationType, params: dict
     ) -> bool:
         """Validate a single environment variable."""
-        if validation_type == ValidationType.CHOICE:
-            choices = params.get("choices", [])
-            return value in choices
-        elif validation_type == ValidationType.BOOLEAN:
-            return value.lower() in [
-                "true",
-                "false",
-                "1",
-                "0",
-                "yes",
-                "no",
-                "on",
-                "off",
-            ]
-        elif validation_type == ValidationType.NUMERIC:
-            try:
-                float(value)
-                return True
-            except ValueError:
-                return False
-        elif validation_type == ValidationType.STRING:
-            return True
-        return False
+        validator = _ENV_VALIDATORS.get(validation_type)
+        if validator is None:
+            return False
+        return validator(value, params)
 
     def _get_validation_error_msg(
         self, name: str, value: str, validation_type: ValidationType, params: dict
@@ -28,6 +28,21 @@ from .protocol_specs import SUPPORTED_PROTOCOL_TYPES, _response_shape_signature
 
 __all__ = ["ProtocolClient", "SUPPORTED_PROTOCOL_TYPES"]
 
+# Follow-up fuzzing of items the server listed, keyed by protocol type.
+_LISTED_FOLLOW_UPS: dict[str, str] = {
+    READ_RESOURCE_REQUEST: "_fuzz_listed_resources",
+    GET_PROMPT_REQUEST: "_fuzz_listed_prompts",
+    "CallToolRequest": "_fuzz_listed_tools",
+}
+_TASK_FOLLOW_UPS = frozenset(
+    {
+        "ListTasksRequest",
+        "GetTaskRequest",
+        "GetTaskPayloadRequest",
+        "CancelTaskRequest",
+    }
+)
+
 
 class ProtocolClient(ProtocolListingsMixin, ProtocolSendHandlers):
     """Client for fuzzing MCP protocol types."""
@@ -107,7 +122,7 @@ class ProtocolClient(ProtocolListingsMixin, ProtocolSendHandlers):
                 self.safety_system.get_blocking_reason() or "blocked_by_safety_system"
             )
             self._logger.warning(
-                f"Safety system blocked {protocol_type} message: {blocking_reason}"
+                "Safety system blocked %s message: %s", protocol_type, blocking_reason
             )
             return {
                 "blocked": True,
@@ -400,7 +415,7 @@ class ProtocolClient(ProtocolListingsMixin, ProtocolSendHandlers):
             return await self._execute_protocol_fuzz(protocol_type, fuzz_data, label)
 
         except Exception as e:
-            self._logger.warning(f"Exception during fuzzing {protocol_type}: {e}")
+            self._logger.warning("Exception during fuzzing %s: %s", protocol_type, e)
             return {
                 "fuzz_data": (fuzz_data if "fuzz_data" in locals() else None),
                 "label": label,
@@ -412,13 +427,18 @@ class ProtocolClient(ProtocolListingsMixin, ProtocolSendHandlers):
             }
 
     async def _run_bounded(self, count: int, factory) -> list[ProtocolFuzzResult]:
-        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # A fixed pool of workers pulls run indices, so no more than
+        # max_concurrency coroutines exist however large ``count`` is.
+        results: list[Any] = [None] * count
+        indices = iter(range(count))
 
-        async def _limited(index: int):
-            async with semaphore:
-                return await factory(index)
+        async def _worker() -> None:
+            for index in indices:
+                results[index] = await factory(index)
 
-        return list(await asyncio.gather(*(_limited(i) for i in range(count))))
+        workers = min(max(1, self.max_concurrency), count)
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return results
 
     async def fuzz_protocol_type(
         self, protocol_type: str, runs: int = 10, phase: str = "realistic"
@@ -463,7 +483,7 @@ class ProtocolClient(ProtocolListingsMixin, ProtocolSendHandlers):
                 await self._append_follow_up_results(results, protocol_type)
             return all_results
         except Exception as e:
-            self._logger.error(f"Failed to fuzz all protocol types: {e}")
+            self._logger.error("Failed to fuzz all protocol types: %s", e)
             return {}
 
     async def _append_follow_up_results(
@@ -471,21 +491,10 @@ class ProtocolClient(ProtocolListingsMixin, ProtocolSendHandlers):
         results: list[ProtocolFuzzResult],
         protocol_type: str,
     ) -> None:
-        if protocol_type == READ_RESOURCE_REQUEST:
-            results.extend(await self._fuzz_listed_resources())
-            return
-        if protocol_type == GET_PROMPT_REQUEST:
-            results.extend(await self._fuzz_listed_prompts())
-            return
-        if protocol_type == "CallToolRequest":
-            results.extend(await self._fuzz_listed_tools())
-            return
-        if protocol_type in {
-            "ListTasksRequest",
-            "GetTaskRequest",
-            "GetTaskPayloadRequest",
-            "CancelTaskRequest",
-        }:
+        handler_name = _LISTED_FOLLOW_UPS.get(protocol_type)
+        if handler_name is not None:
+            results.extend(await getattr(self, handler_name)())
+        elif protocol_type in _TASK_FOLLOW_UPS:
             results.extend(await self._fuzz_observed_tasks(protocol_type))
 
     async def shutdown(self) -> None:
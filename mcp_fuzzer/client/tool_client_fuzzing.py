@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from ..config.constants import (
     DEFAULT_FORCE_KILL_TIMEOUT,
@@ -29,13 +29,18 @@ class ToolClientFuzzingMixin:
 
     async def _run_bounded(self, count: int, factory) -> list[Any]:
         """Run up to ``count`` async factories with concurrency limiting."""
-        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # A fixed pool of workers pulls run indices, so no more than
+        # max_concurrency coroutines exist however large ``count`` is.
+        results: list[Any] = [None] * count
+        indices = iter(range(count))
 
-        async def _limited(index: int):
-            async with semaphore:
-                return await factory(index)
+        async def _worker() -> None:
+            for index in indices:
+                results[index] = await factory(index)
 
-        return list(await asyncio.gather(*(_limited(i) for i in range(count))))
+        workers = min(max(1, self.max_concurrency), count)
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return results
 
     async def fuzz_tool(
         self,
@@ -215,19 +220,21 @@ class ToolClientFuzzingMixin:
             f"  {phase.title()} phase: {successful}/{total} successful"
         )
 
-    async def _run_tool_phase(
+    def _tool_phase_run(
         self,
         tool: dict[str, Any],
         *,
         phase_name: str,
         mutate_phase: str | None,
-        runs: int,
         tool_timeout: float | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> Callable[[int], Awaitable[dict[str, Any]]]:
+        """Return the coroutine factory for one run of a tool fuzzing phase."""
         tool_name = tool.get("name", "unknown")
-        self._logger.info("%s phase: %s", phase_name.title(), tool_name)
 
-        async def _one_run(_index: int) -> dict[str, Any]:
+        async def _one_run(index: int) -> dict[str, Any]:
+            # Runs are pulled in order, so the first run marks the phase start
+            if index == 0:
+                self._logger.info("%s phase: %s", phase_name.title(), tool_name)
             try:
                 if mutate_phase is None:
                     args = await self.tool_mutator.mutate(tool)
@@ -257,7 +264,7 @@ class ToolClientFuzzingMixin:
                     outcome=FuzzOutcome.PHASE_FAILED,
                 )
 
-        return await self._run_bounded(runs, _one_run)
+        return _one_run
 
     async def fuzz_tool_both_phases(
         self,
@@ -270,24 +277,32 @@ class ToolClientFuzzingMixin:
         self._logger.info("Starting two-phase fuzzing for tool: %s", tool_name)
 
         try:
-            realistic_processed = await self._run_tool_phase(
+            realistic_run = self._tool_phase_run(
                 tool,
                 phase_name="realistic",
                 mutate_phase="realistic",
-                runs=runs_per_phase,
                 tool_timeout=tool_timeout,
             )
-            aggressive_processed = await self._run_tool_phase(
+            aggressive_run = self._tool_phase_run(
                 tool,
                 phase_name="aggressive",
                 mutate_phase=None,
-                runs=runs_per_phase,
                 tool_timeout=tool_timeout,
             )
 
+            # Both phases share one worker pool: realistic runs are pulled
+            # first, and aggressive runs fill slots as the realistic tail
+            # drains instead of waiting for the whole phase to finish.
+            def _one_run(index: int) -> Awaitable[dict[str, Any]]:
+                if index < runs_per_phase:
+                    return realistic_run(index)
+                return aggressive_run(index - runs_per_phase)
+
+            processed = await self._run_bounded(2 * max(0, runs_per_phase), _one_run)
+
             return {
-                "realistic": realistic_processed,
-                "aggressive": aggressive_processed,
+                "realistic": processed[:runs_per_phase],
+                "aggressive": processed[runs_per_phase:],
             }
 
         except Exception as e:
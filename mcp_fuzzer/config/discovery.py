@@ -3,11 +3,20 @@
 
 from __future__ import annotations
 
+from functools import cache
 import os
 from pathlib import Path
 
 from .search_params import ConfigSearchParams
 
+_DEFAULT_FILE_NAMES = ("mcp-fuzzer.yml", "mcp-fuzzer.yaml")
+
+
+@cache
+def _user_config_dir() -> str:
+    """Per-user config directory; the home directory does not change mid-run."""
+    return str(Path.home() / ".config" / "mcp-fuzzer")
+
 
 def find_config_file(
     config_path: str | None = None,
@@ -60,21 +69,29 @@ def _find_config_file_impl(params: ConfigSearchParams) -> str | None:
 
     search_paths = params.search_paths
     if search_paths is None:
-        search_paths = [
-            os.getcwd(),
-            str(Path.home() / ".config" / "mcp-fuzzer"),
-        ]
+        # The working directory can change between calls, so only the home
+        # lookup is cached.
+        search_paths = [os.getcwd(), _user_config_dir()]
 
     file_names = params.file_names
     if file_names is None:
-        file_names = ["mcp-fuzzer.yml", "mcp-fuzzer.yaml"]
+        file_names = _DEFAULT_FILE_NAMES
 
+    # One directory listing per search path regardless of how many candidate
+    # names there are; a missing or unreadable search path is skipped.
+    wanted = set(file_names)
     for path in search_paths:
-        if not os.path.isdir(path):
+        try:
+            with os.scandir(path) as entries:
+                found = {
+                    entry.name: entry.path
+                    for entry in entries
+                    if entry.name in wanted and entry.is_file()
+                }
+        except OSError:
             continue
         for name in file_names:
-            file_path = os.path.join(path, name)
-            if os.path.isfile(file_path):
-                return file_path
+            if name in found:
+                return found[name]
 
     return None
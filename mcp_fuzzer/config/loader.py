@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from .manager import Configuration, config
@@ -12,7 +14,7 @@ from .schema_composer import get_config_schema  # noqa: F401 (exported for consu
 from .discovery import find_config_file
 from .parser import load_config_file
 from .search_params import ConfigSearchParams
-from ..exceptions import ConfigFileError, MCPError
+from ..exceptions import MCPError
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,19 @@ FileDiscoverer = Callable[[str | None, list[str] | None, list[str] | None], str
 ConfigParser = Callable[[str], ConfigDict]
 TransportLoader = Callable[[ConfigDict], None]
 
+# Last successful apply per file: its (st_mtime_ns, st_size) and the config
+# snapshot it produced. Re-applying is a no-op only while both still match,
+# i.e. the file is unchanged and nothing has written to the config since.
+_applied: dict[str, tuple[tuple[int, int], Mapping[str, Any]]] = {}
+
+
+def _file_fingerprint(file_path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 class ConfigLoader:
     """Load configuration files with injectable discovery and parser implementations.
@@ -63,21 +78,19 @@ class ConfigLoader:
         if not file_path:
             logger.debug("No configuration file found")
             return None, None
+        return self._load_file(file_path), file_path
 
+    def _load_file(self, file_path: str) -> ConfigDict:
+        """Parse a discovered file and register its custom transports."""
         logger.debug("Loading configuration from %s", file_path)
         try:
             config_data = self.parser(file_path)
             self.transport_loader(config_data)
-        except (ConfigFileError, MCPError) as exc:
+        except MCPError as exc:
             logger.debug("Failed to load configuration from %s: %s", file_path, exc)
             raise
-        except Exception:
-            logger.exception(
-                "Unexpected error while loading configuration from %s", file_path
-            )
-            raise
 
-        return config_data, file_path
+        return config_data
 
     def load_from_params(
         self, params: ConfigSearchParams
@@ -112,16 +125,35 @@ class ConfigLoader:
         Returns:
             True if configuration was loaded and applied, False otherwise
         """
-        try:
-            config_data, file_path = self.load(config_path, search_paths, file_names)
-        except (ConfigFileError, MCPError) as e:
-            logger.debug("Failed to apply configuration: %s", e)
+        file_path = self.discoverer(config_path, search_paths, file_names)
+        if not file_path:
+            logger.debug("No configuration file found")
             return False
 
-        if not file_path:
+        # Only a real Configuration exposes copy-on-write snapshots whose
+        # identity proves nothing was written since the previous apply.
+        tracked = isinstance(self.config, Configuration)
+        cache_key = os.path.abspath(file_path)
+        fingerprint = _file_fingerprint(file_path) if tracked else None
+        previous = _applied.get(cache_key)
+        if (
+            fingerprint is not None
+            and previous is not None
+            and previous[0] == fingerprint
+            and previous[1] is self.config.snapshot()
+        ):
+            logger.debug("Configuration from %s already applied", file_path)
+            return True
+
+        try:
+            config_data = self._load_file(file_path)
+        except MCPError as e:
+            logger.debug("Failed to apply configuration: %s", e)
             return False
 
         self.config.update(config_data or {})
+        if fingerprint is not None:
+            _applied[cache_key] = (fingerprint, self.config.snapshot())
         return True
 
     def apply_from_params(self, params: ConfigSearchParams) -> bool:
@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
 """Configuration management for MCP Fuzzer."""
 
+from collections.abc import Mapping
+from functools import lru_cache
 import os
+from types import MappingProxyType
 from typing import Any
 
-
-def _get_float_from_env(key: str, default: float) -> float:
-    """Get a float value from environment variable.
-
-    Args:
-        key: Environment variable name
-        default: Default value if not set or invalid
-
-    Returns:
-        Float value from environment or default
-    """
-    val = os.getenv(key)
+# Environment keys read when seeding a Configuration. HOME is included because
+# the default fs_root is expanded from it.
+_ENV_KEYS = (
+    "MCP_FUZZER_TIMEOUT",
+    "MCP_FUZZER_LOG_LEVEL",
+    "MCP_FUZZER_SAFETY_ENABLED",
+    "MCP_FUZZER_FS_ROOT",
+    "MCP_FUZZER_HTTP_TIMEOUT",
+    "MCP_FUZZER_SSE_TIMEOUT",
+    "MCP_FUZZER_STDIO_TIMEOUT",
+    "HOME",
+)
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+
+
+def _parse_float(val: str | None, default: float) -> float:
     if val is None:
         return default
     try:
@@ -24,60 +31,63 @@ def _get_float_from_env(key: str, default: float) -> float:
         return default
 
 
-def _get_bool_from_env(key: str, default: bool = False) -> bool:
-    """Get a boolean value from environment variable.
-
-    Args:
-        key: Environment variable name
-        default: Default value if not set
-
-    Returns:
-        Boolean value from environment or default
-    """
-    val = os.getenv(key)
+def _parse_bool(val: str | None, default: bool) -> bool:
     if val is None:
         return default
-    return val.strip().lower() in {"1", "true", "yes", "on"}
+    return val.strip().lower() in _TRUTHY
+
+
+@lru_cache(maxsize=4)
+def _env_defaults(snapshot: tuple[str | None, ...]) -> dict[str, Any]:
+    """Parse environment-derived defaults for one snapshot of ``_ENV_KEYS``."""
+    env = dict(zip(_ENV_KEYS, snapshot))
+    log_level = env["MCP_FUZZER_LOG_LEVEL"]
+    fs_root = env["MCP_FUZZER_FS_ROOT"]
+    return {
+        "timeout": _parse_float(env["MCP_FUZZER_TIMEOUT"], 30.0),
+        "log_level": log_level if log_level is not None else "INFO",
+        "safety_enabled": _parse_bool(env["MCP_FUZZER_SAFETY_ENABLED"], False),
+        "fs_root": (
+            fs_root if fs_root is not None else os.path.expanduser("~/.mcp_fuzzer")
+        ),
+        "http_timeout": _parse_float(env["MCP_FUZZER_HTTP_TIMEOUT"], 30.0),
+        "sse_timeout": _parse_float(env["MCP_FUZZER_SSE_TIMEOUT"], 30.0),
+        "stdio_timeout": _parse_float(env["MCP_FUZZER_STDIO_TIMEOUT"], 30.0),
+    }
 
 
 class Configuration:
-    """Centralized configuration management for MCP Fuzzer."""
+    """Centralized configuration management for MCP Fuzzer.
+
+    Values live in a read-only mapping that writers replace wholesale
+    (copy-on-write), so readers never observe a partially applied update and
+    can hold on to a :meth:`snapshot` for many lookups.
+    """
 
     def __init__(self):
-        self._config: dict[str, Any] = {}
+        self._config: Mapping[str, Any] = MappingProxyType({})
         self._load_from_env()
 
     def _load_from_env(self) -> None:
         """Load configuration values from environment variables."""
-        self._config["timeout"] = _get_float_from_env("MCP_FUZZER_TIMEOUT", 30.0)
-        self._config["log_level"] = os.getenv("MCP_FUZZER_LOG_LEVEL", "INFO")
-        self._config["safety_enabled"] = _get_bool_from_env(
-            "MCP_FUZZER_SAFETY_ENABLED", False
-        )
-        self._config["fs_root"] = os.getenv(
-            "MCP_FUZZER_FS_ROOT", os.path.expanduser("~/.mcp_fuzzer")
-        )
-        self._config["http_timeout"] = _get_float_from_env(
-            "MCP_FUZZER_HTTP_TIMEOUT", 30.0
-        )
-        self._config["sse_timeout"] = _get_float_from_env(
-            "MCP_FUZZER_SSE_TIMEOUT", 30.0
-        )
-        self._config["stdio_timeout"] = _get_float_from_env(
-            "MCP_FUZZER_STDIO_TIMEOUT", 30.0
-        )
+        snapshot = tuple(os.environ.get(key) for key in _ENV_KEYS)
+        self.update(_env_defaults(snapshot))
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key."""
         return self._config.get(key, default)
 
+    def snapshot(self) -> Mapping[str, Any]:
+        """Return the current read-only view of all configuration values."""
+        return self._config
+
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
-        self._config[key] = value
+        self._config = MappingProxyType({**self._config, key: value})
 
     def update(self, config_dict: dict[str, Any]) -> None:
         """Update configuration with values from a dictionary."""
-        self._config.update(config_dict)
+        self._config = MappingProxyType({**self._config, **config_dict})
 
 
 # Global configuration instance
@@ -3,16 +3,66 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import codecs
+import copy
+from functools import cache
 import logging
+import mmap
 import os
-from typing import Any
-
-import yaml
+import stat
+from typing import Any, Final
 
 from ..exceptions import ConfigFileError
 
 logger = logging.getLogger(__name__)
 
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+_YAML_SUFFIXES: Final[tuple[str, ...]] = (".yml", ".yaml")
+
+# Parsed configs keyed by path and validated against (st_mtime_ns, st_size),
+# so reloading an unchanged file costs one stat instead of a full parse.
+_PARSE_CACHE_SIZE = 8
+_parse_cache: OrderedDict[str, tuple[tuple[int, int], dict[str, Any]]] = OrderedDict()
+
+
+@cache
+def _yaml_loader() -> type:
+    """Import PyYAML on first use and pick its fastest safe loader.
+
+    Deferring the import keeps it off the startup path when no config file
+    exists. The libyaml-backed loader is preferred when PyYAML was built with it.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeLoader as loader
+
+        logger.debug("libyaml not available; using pure-Python YAML loader")
+    return loader
+
+
+def _parse_yaml_file(file_path: str) -> Any:
+    """Parse a UTF-8 YAML file straight from a read-only memory map.
+
+    Mapping the file lets libyaml read from the page cache without an
+    intermediate buffered copy. Empty files cannot be mapped and parse to None.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            return None
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:2] in _UTF16_BOMS:
+                raise ConfigFileError(
+                    f"Configuration file {file_path} must be UTF-8 encoded"
+                )
+            import yaml
+
+            return yaml.load(mm, Loader=_yaml_loader())
+    finally:
+        os.close(fd)
+
 
 def load_config_file(file_path: str) -> dict[str, Any]:
     """Load configuration from a YAML file.
@@ -26,18 +76,48 @@ def load_config_file(file_path: str) -> dict[str, Any]:
     Raises:
         ConfigFileError: If the file cannot be found, parsed, or has permission issues
     """
-    if not os.path.isfile(file_path):
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise ConfigFileError(f"Configuration file not found: {file_path}")
 
-    if not file_path.endswith((".yml", ".yaml")):
+    if not file_path.endswith(_YAML_SUFFIXES):
         raise ConfigFileError(
             f"Unsupported configuration file format: {file_path}. "
             "Only YAML files with .yml or .yaml extensions are supported."
         )
 
+    # Normalize so relative and absolute spellings share one cache entry.
+    cache_key = os.path.abspath(file_path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _parse_cache.get(cache_key)
+    if cached is not None and cached[0] == key:
+        _parse_cache.move_to_end(cache_key)
+        return copy.deepcopy(cached[1])
+
+    data = _read_config_file(file_path)
+    _parse_cache[cache_key] = (key, data)
+    _parse_cache.move_to_end(cache_key)
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+    # Callers may mutate the result, so never hand out the cached object.
+    return copy.deepcopy(data)
+
+
+def _read_config_file(file_path: str) -> dict[str, Any]:
+    """Parse and normalize a YAML config file, wrapping failures."""
+    from yaml import YAMLError
+
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        try:
+            data = _parse_yaml_file(file_path) or {}
+        except (ValueError, TypeError) as e:
+            # YAML constructors raise these for malformed scalars (e.g. dates)
+            raise ConfigFileError(
+                f"Error parsing YAML configuration file {file_path}: {e}"
+            ) from e
 
         # Validate that top-level config is a mapping/object
         if not isinstance(data, dict):
@@ -62,7 +142,10 @@ def load_config_file(file_path: str) -> dict[str, Any]:
             data.pop("output_dir", None)
 
         return data
-    except yaml.YAMLError as e:
+    except ConfigFileError:
+        # Already carries the proper context; do not re-wrap it.
+        raise
+    except YAMLError as e:
         raise ConfigFileError(
             f"Error parsing YAML configuration file {file_path}: {e}"
         ) from e
@@ -70,10 +153,7 @@ def load_config_file(file_path: str) -> dict[str, Any]:
         raise ConfigFileError(
             f"Permission denied when reading configuration file: {file_path}"
         ) from e
-    except ConfigFileError:
-        # Re-raise ConfigFileError as-is (already has proper context)
-        raise
-    except Exception as e:
+    except OSError as e:
         raise ConfigFileError(
-            f"Unexpected error reading configuration file {file_path}: {e}"
+            f"Error reading configuration file {file_path}: {e}"
         ) from e
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
 from .schema_builders import (
@@ -18,15 +19,7 @@ from .schema_builders import (
 )
 
 
-def get_config_schema() -> dict[str, Any]:
-    """Return the JSON schema describing the configuration structure.
-
-    The schema is built by composing smaller schema builders for logical
-    groupings of configuration properties.
-
-    Returns:
-        Complete JSON schema dictionary for configuration validation
-    """
+def _build_config_schema() -> dict[str, Any]:
     properties = {}
     properties.update(build_timeout_schema())
     properties.update(build_transport_retry_schema())
@@ -42,3 +35,31 @@ def get_config_schema() -> dict[str, Any]:
         "type": "object",
         "properties": properties,
     }
+
+
+def get_config_schema() -> dict[str, Any]:
+    """Return the JSON schema describing the configuration structure.
+
+    The schema is built by composing smaller schema builders for logical
+    groupings of configuration properties.
+
+    Returns:
+        Complete JSON schema dictionary for configuration validation
+    """
+    return _build_config_schema()
+
+
+@cache
+def get_config_validator() -> Any:
+    """Return a jsonschema validator for the configuration schema.
+
+    The schema is checked and compiled on first use only; later calls reuse
+    the same validator instance.
+    """
+    from jsonschema import Draft202012Validator
+
+    # The validator owns its composition, so callers editing a schema they
+    # got from get_config_schema() cannot affect validation
+    schema = _build_config_schema()
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
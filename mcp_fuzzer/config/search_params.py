@@ -6,7 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigSearchParams:
     """Parameters for searching and loading configuration files.
 
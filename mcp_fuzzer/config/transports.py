@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import importlib
 import logging
+from types import ModuleType
 from typing import Any
 
 from ..exceptions import ConfigFileError, MCPError
@@ -22,13 +23,21 @@ def load_custom_transports(config_data: dict[str, Any]) -> None:
     from ..transport.catalog import register_custom_driver
 
     custom_transports = config_data.get("custom_transports", {})
+    # Transports commonly share a module; resolve each module path only once.
+    modules: dict[str, ModuleType] = {}
+
+    def _import(path: str) -> ModuleType:
+        module = modules.get(path)
+        if module is None:
+            module = modules[path] = importlib.import_module(path)
+        return module
 
     for transport_name, transport_config in custom_transports.items():
         try:
             module_path = transport_config["module"]
             class_name = transport_config["class"]
 
-            module = importlib.import_module(module_path)
+            module = _import(module_path)
             transport_class = getattr(module, class_name)
             try:
                 if not issubclass(transport_class, TransportDriver):
@@ -49,7 +58,7 @@ def load_custom_transports(config_data: dict[str, Any]) -> None:
                     raise ConfigFileError(
                         f"Invalid factory path '{factory_path}'; expected 'module.attr'"
                     ) from ve
-                fmod = importlib.import_module(mod_path)
+                fmod = _import(mod_path)
                 factory_fn = getattr(fmod, attr)
                 if not callable(factory_fn):
                     raise ConfigFileError(f"Factory '{factory_path}' is not callable")
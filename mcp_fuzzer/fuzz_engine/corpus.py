@@ -3,22 +3,36 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from hashlib import sha256
 from pathlib import Path
 import os
 
 
+@lru_cache(maxsize=8)
+def _fs_root_for(env_root: str | None, home: str | None) -> Path:
+    if env_root is not None:
+        return Path(env_root)
+    return Path(os.path.expanduser("~/.mcp_fuzzer"))
+
+
 def default_fs_root() -> Path:
-    return Path(os.getenv("MCP_FUZZER_FS_ROOT", os.path.expanduser("~/.mcp_fuzzer")))
+    # Keyed on the variables it depends on, so env changes are still honored.
+    return _fs_root_for(os.getenv("MCP_FUZZER_FS_ROOT"), os.getenv("HOME"))
 
 
+@lru_cache(maxsize=256)
 def build_target_id(protocol: str, endpoint: str) -> str:
     normalized_protocol = protocol.lower()
     raw = f"{normalized_protocol}::{endpoint}".lower()
-    digest = sha256(raw.encode("utf-8")).hexdigest()[:16]
+    # Only the first 8 bytes are kept, so hex-encode just those.
+    digest = sha256(raw.encode("utf-8"), usedforsecurity=False).digest()[:8].hex()
     return f"{normalized_protocol}-{digest}"
 
 
 def build_corpus_root(fs_root: str | Path | None, target_id: str) -> Path:
-    root = Path(fs_root) if fs_root else default_fs_root()
+    if not fs_root:
+        root = default_fs_root()
+    else:
+        root = fs_root if isinstance(fs_root, Path) else Path(fs_root)
     return root / "corpus" / target_id
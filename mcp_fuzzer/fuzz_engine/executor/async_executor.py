@@ -9,9 +9,10 @@ including wrapping Hypothesis strategies to prevent deadlocks in asyncio.
 import asyncio
 import functools
 import logging
+from contextlib import aclosing
 from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Iterable, Sequence
 
 
 class AsyncFuzzExecutor:
@@ -48,45 +49,111 @@ class AsyncFuzzExecutor:
         return getattr(func, "__name__", "unknown")
 
     async def execute_batch(
-        self, operations: list[tuple[Callable, list[Any], dict[str, Any]]]
+        self, operations: Iterable[tuple[Callable, Sequence[Any], dict[str, Any]]]
     ) -> dict[str, list[Any]]:
         """
         Execute a batch of operations with controlled concurrency.
 
+        Operations are pulled from the iterable lazily, so at most
+        ``max_concurrency`` tasks exist at a time no matter how large the batch.
+
         Args:
-            operations: List of (function, args, kwargs) tuples
+            operations: Iterable of (function, args, kwargs) tuples
 
         Returns:
-            Dictionary with 'results' and 'errors' lists
+            Dictionary with 'results' and 'errors' lists, each in submission order
+
+        Raises:
+            asyncio.CancelledError: As soon as any operation is cancelled; the
+                remaining operations are cancelled and 'errors' never carries
+                a cancellation
         """
-        if self._shutdown:
-            raise RuntimeError("AsyncFuzzExecutor has been shut down")
+        outcomes: dict[int, tuple[bool, Any]] = {}
+        async with aclosing(self.execute_batch_stream(operations)) as stream:
+            async for index, ok, value in stream:
+                outcomes[index] = (ok, value)
 
         results = []
         errors = []
+        for index in range(len(outcomes)):
+            ok, value = outcomes[index]
+            if ok:
+                results.append(value)
+            else:
+                errors.append(value)
 
-        tasks = [
-            asyncio.create_task(
-                self._execute_single(func, args, kwargs),
-                name=f"fuzz_operation_{i}_{self._func_name(func)}",
-            )
-            for i, (func, args, kwargs) in enumerate(operations)
-        ]
+        return {"results": results, "errors": errors}
 
-        completed = await asyncio.gather(*tasks, return_exceptions=True)
+    async def execute_batch_stream(
+        self, operations: Iterable[tuple[Callable, Sequence[Any], dict[str, Any]]]
+    ) -> AsyncIterator[tuple[int, bool, Any]]:
+        """
+        Execute a batch of operations, yielding each outcome as it completes.
 
-        for result in completed:
-            if isinstance(result, BaseException):
-                if isinstance(result, asyncio.CancelledError):
-                    raise result
-                errors.append(result)
-            else:
-                results.append(result)
+        Concurrency is bounded exactly as in ``execute_batch``, but nothing is
+        buffered, so callers that persist or discard outcomes as they arrive
+        keep peak memory independent of the batch size. Close the generator
+        (e.g. with ``contextlib.aclosing``) to cancel the operations still
+        running when stopping early.
 
-        return {"results": results, "errors": errors}
+        Args:
+            operations: Iterable of (function, args, kwargs) tuples
+
+        Yields:
+            (index, ok, value) tuples in completion order, where index is the
+            submission position and value is the result when ok is True or the
+            raised exception otherwise
+
+        Raises:
+            asyncio.CancelledError: As soon as any operation is cancelled
+        """
+        if self._shutdown:
+            raise RuntimeError("AsyncFuzzExecutor has been shut down")
+
+        pending_ops = enumerate(operations)
+        running: dict[asyncio.Task, int] = {}
+
+        def _launch_next() -> bool:
+            item = next(pending_ops, None)
+            if item is None:
+                return False
+            i, (func, args, kwargs) = item
+            task = asyncio.create_task(
+                self._execute_single(func, args, kwargs),
+                name=f"fuzz_operation_{i}_{self._func_name(func)}",
+            )
+            running[task] = i
+            return True
+
+        try:
+            while len(running) < self.max_concurrency and _launch_next():
+                pass
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                finished = []
+                for task in done:
+                    index = running.pop(task)
+                    if task.cancelled():
+                        # Abort the batch; the finally clause cancels the rest
+                        raise asyncio.CancelledError()
+                    finished.append((index, task))
+                # Refill the freed slots before handing outcomes to the caller
+                while len(running) < self.max_concurrency and _launch_next():
+                    pass
+                for index, task in finished:
+                    exc = task.exception()
+                    if exc is None:
+                        yield index, True, task.result()
+                    else:
+                        yield index, False, exc
+        finally:
+            for task in running:
+                task.cancel()
 
     async def _execute_single(
-        self, func: Callable, args: list[Any], kwargs: dict[str, Any]
+        self, func: Callable, args: Sequence[Any], kwargs: dict[str, Any]
     ) -> Any:
         """
         Execute a single operation with semaphore-controlled concurrency.
@@ -88,7 +88,7 @@ class BatchExecutor:
                 )
                 results.append(result)
 
-                self._logger.debug(f"Fuzzed batch request run {run_index + 1}")
+                self._logger.debug("Fuzzed batch request run %s", run_index + 1)
 
             except Exception as e:
                 self._logger.error(
@@ -23,7 +23,8 @@ from typing import Any
 
 # Optional jsonschema validation support
 try:
-    from jsonschema import validate as jsonschema_validate
+    from jsonschema import validators as jsonschema_validators
+    from jsonschema.exceptions import best_match
 
     HAVE_JSONSCHEMA = True
 except ImportError:
@@ -34,6 +35,30 @@ except ImportError:
         """Placeholder when jsonschema is not available."""
         pass
 
+else:
+    # Checked validators keyed by schema identity. Each entry holds the schema
+    # itself, so its id cannot be recycled while the entry is alive.
+    _VALIDATOR_CACHE_SIZE = 128
+    _validators: dict[int, tuple[dict[str, Any], Any]] = {}
+
+    def jsonschema_validate(instance, schema):
+        """Validate like ``jsonschema.validate``, checking each schema once.
+
+        ``jsonschema.validate`` re-checks the schema against its metaschema and
+        builds a new validator on every call; fuzzing validates many responses
+        against the same few schemas, so the checked validator is reused.
+        """
+        entry = _validators.get(id(schema))
+        if entry is None or entry[0] is not schema:
+            cls = jsonschema_validators.validator_for(schema)
+            cls.check_schema(schema)
+            if len(_validators) >= _VALIDATOR_CACHE_SIZE:
+                _validators.clear()
+            entry = _validators[id(schema)] = (schema, cls(schema))
+        error = best_match(entry[1].iter_errors(instance))
+        if error is not None:
+            raise error
+
 
 logger = logging.getLogger(__name__)
 
@@ -64,72 +89,62 @@ def check_response_validity(response: Any) -> bool:
     if response is None:
         raise InvariantViolation("Response is None")
 
-    # For JSON-RPC responses, check required fields
-    if isinstance(response, dict):
-        if "jsonrpc" in response:
-            # This appears to be a JSON-RPC response
-            if response.get("jsonrpc") != "2.0":
-                raise InvariantViolation(
-                    f"Invalid JSON-RPC version: {response.get('jsonrpc')}", response
-                )
-
-            # Check that response has either result or error, but not both
-            has_result = "result" in response
-            has_error = "error" in response
-
-            if has_result and has_error:
-                raise InvariantViolation(
-                    "JSON-RPC response cannot have both 'result' and 'error'", response
-                )
-
-            # Determine if this is a notification, request, or response
-            has_id = "id" in response
-            has_method = "method" in response
-
-            # If it has method but no id, it's a notification (valid)
-            if has_method and not has_id:
-                # Notifications don't need result/error
-                return True
-
-            # If it has id but no method, it's a response and needs result or error
-            if not has_result and not has_error and has_id and not has_method:
-                # Responses must have result or error
-                raise InvariantViolation(
-                    "JSON-RPC response must have either 'result' or 'error'",
-                    response,
-                )
-
-            # If it has both method and id, this is a request; reject here
-            if has_method and has_id and not (has_result or has_error):
-                raise InvariantViolation(
-                    "Received a JSON-RPC request where a response was expected",
-                    response,
-                )
-
-            # id is required for any response (result or error)
-            # but not for notifications (which have method but no id)
-            if (has_result or has_error) and not has_method:
-                if "id" not in response:
-                    raise InvariantViolation("JSON-RPC response missing 'id'", response)
-                if (
-                    not isinstance(response["id"], (int, str))
-                    and response["id"] is not None
-                ):
-                    raise InvariantViolation(
-                        f"JSON-RPC id must be int, str, or null; "
-                        f"got {type(response['id'])}",
-                        response,
-                    )
-        else:
-            # If dict but not a JSON-RPC envelope, optionally treat as invalid
-            raise InvariantViolation(
-                "Unexpected non JSON-RPC response object", response
-            )
-    else:
+    if not isinstance(response, dict):
         raise InvariantViolation(
             f"Unexpected response type: {type(response)}", response
         )
 
+    # A dict that is not a JSON-RPC envelope is treated as invalid
+    if "jsonrpc" not in response:
+        raise InvariantViolation("Unexpected non JSON-RPC response object", response)
+
+    jsonrpc = response["jsonrpc"]
+    if jsonrpc != "2.0":
+        raise InvariantViolation(f"Invalid JSON-RPC version: {jsonrpc}", response)
+
+    # Look every member up once and decide from the flags below
+    has_result = "result" in response
+    has_error = "error" in response
+    has_id = "id" in response
+    has_method = "method" in response
+    is_reply = has_result or has_error
+
+    # A response has either result or error, but not both
+    if has_result and has_error:
+        raise InvariantViolation(
+            "JSON-RPC response cannot have both 'result' and 'error'", response
+        )
+
+    # Method without id is a notification, which needs no result/error
+    if has_method and not has_id:
+        return True
+
+    if not is_reply:
+        # Method and id make this a request where a response was expected
+        if has_method:
+            raise InvariantViolation(
+                "Received a JSON-RPC request where a response was expected",
+                response,
+            )
+        # Id without method is a response, which needs result or error
+        if has_id:
+            raise InvariantViolation(
+                "JSON-RPC response must have either 'result' or 'error'",
+                response,
+            )
+        return True
+
+    # id is required for any response (result or error)
+    if not has_method:
+        if not has_id:
+            raise InvariantViolation("JSON-RPC response missing 'id'", response)
+        response_id = response["id"]
+        if response_id is not None and not isinstance(response_id, (int, str)):
+            raise InvariantViolation(
+                f"JSON-RPC id must be int, str, or null; got {type(response_id)}",
+                response,
+            )
+
     return True
 
 
@@ -168,22 +183,17 @@ def check_error_type_correctness(
                 error,
             )
 
-        if not isinstance(error["message"], str):
+        message = error["message"]
+        if not isinstance(message, str):
             raise InvariantViolation(
-                (
-                    f"JSON-RPC error message must be a string, "
-                    f"got {type(error['message'])}"
-                ),
+                f"JSON-RPC error message must be a string, got {type(message)}",
                 error,
             )
 
         # Check if error code is in expected codes
-        if expected_codes and error["code"] not in expected_codes:
+        if expected_codes and code not in expected_codes:
             raise InvariantViolation(
-                (
-                    f"Unexpected error code: {error['code']}, "
-                    f"expected one of {expected_codes}"
-                ),
+                f"Unexpected error code: {code}, expected one of {expected_codes}",
                 error,
             )
     else:
@@ -241,8 +251,9 @@ def verify_response_invariants(
     # Check response validity
     check_response_validity(response)
 
-    # Check error type correctness if response has an error
-    if isinstance(response, dict) and "error" in response:
+    # Check error type correctness if response has an error; validity above
+    # guarantees the response is a dict
+    if "error" in response:
         check_error_type_correctness(response["error"], expected_error_codes)
 
     # Check schema conformity if schema is provided
@@ -286,27 +297,44 @@ async def verify_batch_responses(
     if len(responses) == 0:
         return results
 
-    # Process responses in parallel using asyncio
+    # Structural checks are a handful of dict probes, far cheaper than a thread
+    # hand-off, so without a schema the batch is verified inline in one pass
+    if schema is None:
+        return {
+            i: _verify_response_outcome(resp, expected_error_codes, schema)
+            for i, resp in enumerate(responses)
+        }
+
+    # Schema validation can be slow, so keep it off the event loop
     async def _verify_single_response(idx, resp):
         try:
-            # Use to_thread to avoid blocking the event loop
-            await asyncio.to_thread(
-                verify_response_invariants, resp, expected_error_codes, schema
+            return idx, await asyncio.to_thread(
+                _verify_response_outcome, resp, expected_error_codes, schema
             )
-            return idx, True
-        except InvariantViolation as e:
-            return idx, str(e)
         except Exception as e:
             return idx, f"Unexpected error: {str(e)}"
 
-    # Create tasks for all responses
-    tasks = [_verify_single_response(i, resp) for i, resp in enumerate(responses)]
+    # Gather (index, result) pairs straight into the mapping
+    return dict(
+        await asyncio.gather(
+            *(_verify_single_response(i, resp) for i, resp in enumerate(responses))
+        )
+    )
 
-    # Gather results
-    for idx, result in await asyncio.gather(*tasks, return_exceptions=False):
-        results[idx] = result
 
-    return results
+def _verify_response_outcome(
+    response: Any,
+    expected_error_codes: list[int] | None,
+    schema: dict[str, Any] | None,
+) -> bool | str:
+    """Return True for a valid response, otherwise the violation message."""
+    try:
+        verify_response_invariants(response, expected_error_codes, schema)
+        return True
+    except InvariantViolation as e:
+        return str(e)
+    except Exception as e:
+        return f"Unexpected error: {str(e)}"
 
 
 def check_state_consistency(
@@ -328,25 +356,21 @@ def check_state_consistency(
     Raises:
         InvariantViolation: If the state is inconsistent
     """
-    # Check if all keys in before_state are still in after_state
-    for key in before_state:
+    allowed = set(expected_changes or ())
+
+    # One pass over before_state checks both presence and unchanged values
+    for key, before_value in before_state.items():
         if key not in after_state:
             raise InvariantViolation(f"Key '{key}' missing in after_state")
+        after_value = after_state[key]
+        if before_value != after_value and key not in allowed:
+            raise InvariantViolation(
+                f"Unexpected change in '{key}': {before_value} -> {after_value}"
+            )
 
     # Check if any unexpected keys were added
     for key in after_state:
-        if key not in before_state:
-            if not expected_changes or key not in expected_changes:
-                raise InvariantViolation(f"Unexpected key '{key}' added to after_state")
-
-    # Check if any values changed unexpectedly
-    for key in before_state:
-        if key in after_state:
-            if before_state[key] != after_state[key]:
-                if not expected_changes or key not in expected_changes:
-                    raise InvariantViolation(
-                        f"Unexpected change in '{key}': "
-                        f"{before_state[key]} -> {after_state[key]}"
-                    )
+        if key not in before_state and key not in allowed:
+            raise InvariantViolation(f"Unexpected key '{key}' added to after_state")
 
     return True
@@ -6,8 +6,11 @@ This module contains execution orchestration logic for protocol fuzzing.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, ClassVar
+from contextlib import aclosing
+from typing import Any, Callable, ClassVar, Iterable, Sequence
 
 from ...types import FuzzDataResult
 from ...protocol_registry import EXECUTABLE_PROTOCOL_TYPES
@@ -29,6 +32,11 @@ class ProtocolExecutor:
     PROTOCOL_TYPES: ClassVar[tuple[str, ...]] = EXECUTABLE_PROTOCOL_TYPES
     # Seconds to wait for invariant validation of batch responses
     BATCH_VALIDATION_TIMEOUT: ClassVar[float] = 5.0
+    # Seconds allowed per protocol type in execute_all_types; on expiry the
+    # type's in-flight runs are cancelled rather than left to finish
+    TYPE_TIMEOUT: ClassVar[float] = 30.0
+    # Extra generations a deduplicating run makes before giving up its slot
+    DEDUPE_ATTEMPTS: ClassVar[int] = 3
 
     def __init__(
         self,
@@ -59,17 +67,6 @@ class ProtocolExecutor:
         self.result_builder = result_builder or ResultBuilder()
         self.collector = result_collector or ResultCollector()
         self._logger = logging.getLogger(__name__)
-        # Bound concurrent protocol-type tasks
-        self._type_semaphore: asyncio.Semaphore | None = None
-        self._type_semaphore_loop: asyncio.AbstractEventLoop | None = None
-
-    def _get_type_semaphore(self):
-        """Get or create the type semaphore for the running event loop."""
-        loop = asyncio.get_running_loop()
-        if self._type_semaphore is None or self._type_semaphore_loop is not loop:
-            self._type_semaphore = asyncio.Semaphore(self.executor.max_concurrency)
-            self._type_semaphore_loop = loop
-        return self._type_semaphore
 
     async def execute(
         self,
@@ -77,6 +74,7 @@ class ProtocolExecutor:
         runs: int = 10,
         phase: str = "aggressive",
         generate_only: bool = False,
+        dedupe: bool = False,
     ) -> list[FuzzDataResult]:
         """
         Execute fuzzing runs for a protocol type.
@@ -86,6 +84,9 @@ class ProtocolExecutor:
             runs: Number of fuzzing runs
             phase: Fuzzing phase (realistic or aggressive)
             generate_only: If True, only generate fuzzing data without sending requests
+            dedupe: If True, regenerate payloads already produced by an earlier
+                run and drop runs that cannot find a new one, so identical
+                inputs are not executed twice
 
         Returns:
             List of fuzzing results
@@ -93,65 +94,78 @@ class ProtocolExecutor:
         if runs <= 0:
             return []
 
-        # Get the fuzzer method for this protocol type
+        # Resolve the fuzzer method once and share it across all runs
         fuzzer_method = self.mutator.get_fuzzer_method(protocol_type, phase)
         if not fuzzer_method:
             return []
 
-        # Prepare fuzzing operations
-        operations = []
-        for i in range(runs):
-            operations.append(
-                (
-                    self._execute_single_run,
-                    [protocol_type, i, phase, generate_only],
-                    {},
-                )
+        # Produce fuzzing operations lazily; the executor pulls them as slots free
+        run_kwargs: dict[str, Any] = {"fuzzer_method": fuzzer_method}
+        if dedupe:
+            run_kwargs["seen"] = set()
+        operations = (
+            (
+                self._execute_single_run,
+                (protocol_type, i, phase, generate_only),
+                run_kwargs,
             )
+            for i in range(runs)
+        )
 
         # Execute operations and process results
         return await self._execute_and_process_operations(operations, protocol_type)
 
     async def _execute_and_process_operations(
         self,
-        operations: list[tuple[Any, list[Any], dict[str, Any]]],
+        operations: Iterable[tuple[Any, Sequence[Any], dict[str, Any]]],
         protocol_type: str,
     ) -> list[FuzzDataResult]:
         """
         Execute operations and process results.
 
         Args:
-            operations: List of operations to execute
+            operations: Operations to execute
             protocol_type: Protocol type being fuzzed
 
         Returns:
             List of fuzzing results
         """
-        # Execute all operations in parallel with controlled concurrency
-        batch_results = await self.executor.execute_batch(operations)
-
-        # Process results
-        results = [
-            result for result in batch_results["results"] if result is not None
-        ]
-
-        # Process errors
-        for error in batch_results["errors"]:
-            if isinstance(error, asyncio.CancelledError):
-                raise error
-            self._logger.error("Error fuzzing %s: %s", protocol_type, error)
-            results.append(
-                {
+        # Consume outcomes as they complete instead of buffering the whole batch;
+        # cancellation is raised by the stream itself
+        results: dict[int, FuzzDataResult] = {}
+        errors: dict[int, FuzzDataResult] = {}
+        async with aclosing(self.executor.execute_batch_stream(operations)) as stream:
+            async for index, ok, value in stream:
+                if ok:
+                    if value is not None:
+                        results[index] = value
+                    continue
+                self._logger.error("Error fuzzing %s: %s", protocol_type, value)
+                errors[index] = {
                     "protocol_type": protocol_type,
                     # Use -1 to indicate a batch-level error without a run index.
                     "run": -1,
                     "fuzz_data": {},
                     "success": False,
-                    "exception": str(error),
+                    "exception": str(value),
                 }
-            )
 
-        return results
+        # Results in submission order, followed by errors
+        return [results[i] for i in sorted(results)] + [
+            errors[i] for i in sorted(errors)
+        ]
+
+    @staticmethod
+    def _payload_digest(fuzz_data: Any) -> bytes:
+        """Return a fixed-size dedupe key for a generated payload."""
+        try:
+            key = json.dumps(fuzz_data, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            # Keys of mixed or non-string types cannot be sorted or encoded
+            key = repr(fuzz_data)
+        return hashlib.blake2b(
+            key.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
 
     async def _execute_single_run(
         self,
@@ -159,7 +173,9 @@ class ProtocolExecutor:
         run_index: int,
         phase: str,
         generate_only: bool = False,
-    ) -> FuzzDataResult:
+        fuzzer_method: Callable[..., Any] | None = None,
+        seen: set[bytes] | None = None,
+    ) -> FuzzDataResult | None:
         """
         Execute a single fuzzing run for a protocol type.
 
@@ -168,13 +184,47 @@ class ProtocolExecutor:
             run_index: Run index (0-based)
             phase: Fuzzing phase
             generate_only: If True, only generate fuzzing data without sending requests
+            fuzzer_method: Pre-resolved fuzzer method shared by all runs
+            seen: Payload digests already produced in this batch; when given,
+                duplicates are regenerated and the run is skipped if every
+                attempt repeats an earlier payload
 
         Returns:
-            Fuzzing result
+            Fuzzing result, or None for a run skipped as a duplicate
         """
         try:
             # Generate fuzz data using mutator
-            fuzz_data = await self.mutator.mutate(protocol_type, phase)
+            attempts = 1 if seen is None else 1 + self.DEDUPE_ATTEMPTS
+            for _ in range(attempts):
+                if fuzzer_method is None:
+                    fuzz_data = await self.mutator.mutate(protocol_type, phase)
+                else:
+                    fuzz_data = await self.mutator.mutate(
+                        protocol_type, phase, fuzzer_method=fuzzer_method
+                    )
+                if seen is None:
+                    break
+                # No await between check and add, so concurrent runs cannot
+                # both claim the same payload
+                key = self._payload_digest(fuzz_data)
+                if key not in seen:
+                    seen.add(key)
+                    break
+            else:
+                self._logger.debug(
+                    "Skipping duplicate %s run %s", protocol_type, run_index + 1
+                )
+                return None
+
+            # Nothing is sent, so there is no response to validate
+            if generate_only or not self.transport:
+                self._logger.debug("Fuzzed %s run %s", protocol_type, run_index + 1)
+                return self.result_builder.build_protocol_result(
+                    protocol_type=protocol_type,
+                    run_index=run_index,
+                    fuzz_data=fuzz_data,
+                    spec_checks=[],
+                )
 
             # Send request if needed
             server_response, server_error = await self._send_fuzzed_request(
@@ -183,7 +233,7 @@ class ProtocolExecutor:
 
             # Verify invariants if we have a server response
             invariant_violations = []
-            if server_response is not None and not generate_only:
+            if server_response is not None:
                 try:
                     # Batch: either a raw list of responses or a collated mapping
                     # {id: response}
@@ -219,7 +269,7 @@ class ProtocolExecutor:
 
             spec_checks: list[dict[str, Any]] = []
             spec_scope: str | None = None
-            if isinstance(server_response, dict) and not generate_only:
+            if isinstance(server_response, dict):
                 payload = server_response.get("result", server_response)
                 method = (
                     fuzz_data.get("method") if isinstance(fuzz_data, dict) else None
@@ -240,7 +290,7 @@ class ProtocolExecutor:
                 spec_scope=spec_scope,
             )
 
-            self._logger.debug(f"Fuzzed {protocol_type} run {run_index + 1}")
+            self._logger.debug("Fuzzed %s run %s", protocol_type, run_index + 1)
             return result
 
         except asyncio.CancelledError:
@@ -295,7 +345,7 @@ class ProtocolExecutor:
                     server_response = await self.transport.send_raw(fuzz_data)
 
                 self._logger.debug(
-                    f"Server accepted fuzzed envelope for {protocol_type}"
+                    "Server accepted fuzzed envelope for %s", protocol_type
                 )
             except Exception as server_exception:
                 server_error = str(server_exception)
@@ -321,16 +371,16 @@ class ProtocolExecutor:
         """
         results = {}
 
-        self._logger.info(f"Running two-phase fuzzing for {protocol_type}")
+        self._logger.info("Running two-phase fuzzing for %s", protocol_type)
 
         # Phase 1: Realistic fuzzing
-        self._logger.info(f"Phase 1: Realistic fuzzing for {protocol_type}")
+        self._logger.info("Phase 1: Realistic fuzzing for %s", protocol_type)
         results["realistic"] = await self.execute(
             protocol_type, runs=runs_per_phase, phase="realistic"
         )
 
         # Phase 2: Aggressive fuzzing
-        self._logger.info(f"Phase 2: Aggressive fuzzing for {protocol_type}")
+        self._logger.info("Phase 2: Aggressive fuzzing for %s", protocol_type)
         results["aggressive"] = await self.execute(
             protocol_type, runs=runs_per_phase, phase="aggressive"
         )
@@ -353,51 +403,34 @@ class ProtocolExecutor:
         if runs_per_type <= 0:
             return {}
 
-        all_results = {}
-
-        # Create tasks for each protocol type with bounded concurrency
-        tasks = []
-        sem = self._get_type_semaphore()
-
-        async def _run(pt: str) -> list[dict[str, Any]]:
-            async with sem:
-                return await self._execute_single_type(pt, runs_per_type, phase)
-
-        async def _run_with_type(
-            pt: str,
-        ) -> tuple[str, list[dict[str, Any]], Exception | None]:
+        async def _run_with_type(pt: str) -> list[dict[str, Any]]:
+            # Failures are logged as each type finishes, not after the slowest
             try:
-                results = await asyncio.wait_for(_run(pt), timeout=30.0)
-                return pt, results, None
+                return await asyncio.wait_for(
+                    self._execute_single_type(pt, runs_per_type, phase),
+                    timeout=self.TYPE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                self._logger.error("Timeout while fuzzing %s", pt)
             except Exception as exc:
-                return pt, [], exc
+                self._logger.error("Failed to fuzz %s: %s", pt, exc)
+            return []
 
-        for protocol_type in self.PROTOCOL_TYPES:
-            tasks.append(
-                asyncio.create_task(
-                    _run_with_type(protocol_type),
-                    name=f"fuzz_protocol_{protocol_type}",
-                )
-            )
+        # A fixed pool of workers pulls protocol types; the pool size bounds
+        # concurrency, each type still carries its own timeout, and results
+        # are keyed in PROTOCOL_TYPES order.
+        protocol_types = self.PROTOCOL_TYPES
+        outcomes: list[list[dict[str, Any]]] = [[] for _ in protocol_types]
+        pending = iter(enumerate(protocol_types))
 
-        # Process tasks as they complete for more responsive timeouts.
-        for task in asyncio.as_completed(tasks):
-            try:
-                protocol_type, results, exc = await task
-            except Exception as exc:
-                self._logger.error("Failed to fuzz protocol types: %s", exc)
-                continue
-
-            if exc is None:
-                all_results[protocol_type] = results
-            elif isinstance(exc, asyncio.TimeoutError):
-                self._logger.error("Timeout while fuzzing %s", protocol_type)
-                all_results[protocol_type] = []
-            else:
-                self._logger.error("Failed to fuzz %s: %s", protocol_type, exc)
-                all_results[protocol_type] = []
+        async def _worker() -> None:
+            for index, pt in pending:
+                outcomes[index] = await _run_with_type(pt)
+
+        workers = min(self.executor.max_concurrency, len(protocol_types))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
 
-        return all_results
+        return dict(zip(protocol_types, outcomes))
 
     async def _execute_single_type(
         self,
@@ -416,15 +449,18 @@ class ProtocolExecutor:
         Returns:
             List of fuzzing results
         """
-        self._logger.info(f"Starting to fuzz protocol type: {protocol_type}")
+        self._logger.info("Starting to fuzz protocol type: %s", protocol_type)
 
         results = await self.execute(protocol_type, runs, phase)
 
-        # Log summary
-        successful = len([r for r in results if r.get("success", False)])
-        server_rejections = len(
-            [r for r in results if r.get("server_rejected_input", False)]
-        )
+        # Log summary, counting both outcomes in one pass
+        successful = 0
+        server_rejections = 0
+        for r in results:
+            if r.get("success", False):
+                successful += 1
+            if r.get("server_rejected_input", False):
+                server_rejections += 1
         total = len(results)
 
         self._logger.info(
@@ -484,7 +520,7 @@ class ProtocolExecutor:
                 )
                 results.append(result)
 
-                self._logger.debug(f"Fuzzed batch request run {run_index + 1}")
+                self._logger.debug("Fuzzed batch request run %s", run_index + 1)
 
             except Exception as e:
                 self._logger.error(
@@ -83,15 +83,17 @@ class ResultBuilder:
         spec_checks: list[dict[str, Any]] | None = None,
         spec_scope: str | None = None,
     ) -> FuzzDataResult:
+        rejected = server_error is not None
+        violations = invariant_violations or []
         result: FuzzDataResult = {
             "protocol_type": protocol_type,
             "run": run_index + 1,
             "fuzz_data": fuzz_data,
-            "success": server_error is None and not (invariant_violations or []),
+            "success": not rejected and not violations,
             "server_response": server_response,
             "server_error": server_error,
-            "server_rejected_input": server_error is not None,
-            "invariant_violations": invariant_violations or [],
+            "server_rejected_input": rejected,
+            "invariant_violations": violations,
         }
         if spec_checks is not None:
             result["spec_checks"] = spec_checks
@@ -108,14 +110,15 @@ class ResultBuilder:
         server_error: str | None = None,
         invariant_violations: list[str] | None = None,
     ) -> FuzzDataResult:
+        rejected = server_error is not None
         result: FuzzDataResult = {
             "protocol_type": "BatchRequest",
             "run": run_index + 1,
             "fuzz_data": batch_request,
-            "success": server_error is None,
+            "success": not rejected,
             "server_response": server_response,
             "server_error": server_error,
-            "server_rejected_input": server_error is not None,
+            "server_rejected_input": rejected,
             "batch_size": len(batch_request),
             "invariant_violations": invariant_violations or [],
         }
@@ -148,10 +151,13 @@ class MetricsCalculator:
         self, results: list[dict[str, Any]]
     ) -> dict[str, Any]:
         total = len(results)
-        successful = len([r for r in results if r.get("success", False)])
-        server_rejections = len(
-            [r for r in results if r.get("server_rejected_input", False)]
-        )
+        successful = 0
+        server_rejections = 0
+        for r in results:
+            if r.get("success", False):
+                successful += 1
+            if r.get("server_rejected_input", False):
+                server_rejections += 1
 
         return {
             "total": total,
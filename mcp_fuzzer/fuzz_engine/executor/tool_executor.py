@@ -63,18 +63,18 @@ class ToolExecutor:
             List of fuzzing results
         """
         tool_name = tool.get("name", "unknown")
-        self._logger.info(f"Starting fuzzing for tool: {tool_name}")
+        self._logger.info("Starting fuzzing for tool: %s", tool_name)
 
-        operations = [
-            (self._execute_single_run, [tool, i, phase], {}) for i in range(runs)
-        ]
+        operations = (
+            (self._execute_single_run, (tool, i, phase), {}) for i in range(runs)
+        )
 
         # Execute all operations in parallel with controlled concurrency
         batch_results = await self.executor.execute_batch(operations)
 
         results = self.collector.collect_results(batch_results)
         for error in batch_results.get("errors", []):
-            self._logger.warning(f"Error during fuzzing {tool_name}: {error}")
+            self._logger.warning("Error during fuzzing %s: %s", tool_name, error)
         return results
 
     async def _execute_single_run(
@@ -122,8 +122,11 @@ class ToolExecutor:
 
             # Keep high-level progress at DEBUG to avoid noisy INFO
             self._logger.debug(
-                f"Fuzzing {tool_name} ({phase} phase, run {run_index + 1}) "
-                f"with args: {sanitized_args}"
+                "Fuzzing %s (%s phase, run %s) with args: %s",
+                tool_name,
+                phase,
+                run_index + 1,
+                sanitized_args,
             )
 
             return self.result_builder.build_tool_result(
@@ -136,7 +139,7 @@ class ToolExecutor:
             )
 
         except Exception as e:
-            self._logger.warning(f"Exception during fuzzing {tool_name}: {e}")
+            self._logger.warning("Exception during fuzzing %s: %s", tool_name, e)
             return self.result_builder.build_tool_result(
                 tool_name=tool_name,
                 run_index=run_index,
@@ -161,16 +164,16 @@ class ToolExecutor:
         results = {}
         tool_name = tool.get("name", "unknown")
 
-        self._logger.info(f"Running two-phase fuzzing for tool: {tool_name}")
+        self._logger.info("Running two-phase fuzzing for tool: %s", tool_name)
 
         # Phase 1: Realistic fuzzing
-        self._logger.info(f"Phase 1: Realistic fuzzing for {tool_name}")
+        self._logger.info("Phase 1: Realistic fuzzing for %s", tool_name)
         results["realistic"] = await self.execute(
             tool, runs=runs_per_phase, phase="realistic"
         )
 
         # Phase 2: Aggressive fuzzing
-        self._logger.info(f"Phase 2: Aggressive fuzzing for {tool_name}")
+        self._logger.info("Phase 2: Aggressive fuzzing for %s", tool_name)
         results["aggressive"] = await self.execute(
             tool, runs=runs_per_phase, phase="aggressive"
         )
@@ -216,7 +219,7 @@ class ToolExecutor:
                 results = await task
                 all_results[tool_name] = results
             except Exception as e:
-                self._logger.error(f"Failed to fuzz tool {tool_name}: {e}")
+                self._logger.error("Failed to fuzz tool %s: %s", tool_name, e)
                 all_results[tool_name] = [{"error": str(e)}]
 
         return all_results
@@ -239,7 +242,7 @@ class ToolExecutor:
             List of fuzzing results
         """
         tool_name = tool.get("name", "unknown")
-        self._logger.info(f"Starting to fuzz tool: {tool_name}")
+        self._logger.info("Starting to fuzz tool: %s", tool_name)
 
         results = await self.execute(tool, runs_per_tool, phase)
 
@@ -13,7 +13,7 @@ import random
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FuzzerContext:
     """
     Context for deterministic, schema-aware fuzzing.
@@ -35,6 +35,8 @@ class FuzzerContext:
     havoc_max: int = 6
 
     def with_defaults(self) -> "FuzzerContext":
+        if self.rng is not None and self.run_index is not None:
+            return self
         rng = self.rng or random.Random()
         run_index = (
             self.run_index if self.run_index is not None else rng.randint(0, 1_000_000)
@@ -56,33 +58,33 @@ def ensure_context(
     havoc_max: int | None = None,
 ) -> FuzzerContext:
     """Create or normalize a FuzzerContext with safe defaults."""
-    if context is None:
-        context = FuzzerContext(
-            phase=phase,
-            schema=schema,
-            key=key,
-            run_index=run_index,
-            rng=rng,
-            corpus_dir=corpus_dir,
-            havoc_mode=bool(havoc_mode) if havoc_mode is not None else False,
-            havoc_min=havoc_min if havoc_min is not None else 2,
-            havoc_max=havoc_max if havoc_max is not None else 6,
-        )
-    else:
-        context = replace(
-            context,
-            phase=phase if phase is not None else context.phase,
-            schema=schema if schema is not None else context.schema,
-            key=key if key is not None else context.key,
-            run_index=run_index if run_index is not None else context.run_index,
-            rng=rng if rng is not None else context.rng,
-            corpus_dir=corpus_dir if corpus_dir is not None else context.corpus_dir,
-            havoc_mode=(
-                bool(havoc_mode)
-                if havoc_mode is not None
-                else context.havoc_mode
-            ),
-            havoc_min=havoc_min if havoc_min is not None else context.havoc_min,
-            havoc_max=havoc_max if havoc_max is not None else context.havoc_max,
-        )
-    return context.with_defaults()
+    if context is not None:
+        phase = phase if phase is not None else context.phase
+        schema = schema if schema is not None else context.schema
+        key = key if key is not None else context.key
+        run_index = run_index if run_index is not None else context.run_index
+        rng = rng if rng is not None else context.rng
+        corpus_dir = corpus_dir if corpus_dir is not None else context.corpus_dir
+        if havoc_mode is None:
+            havoc_mode = context.havoc_mode
+        if havoc_min is None:
+            havoc_min = context.havoc_min
+        if havoc_max is None:
+            havoc_max = context.havoc_max
+
+    # Resolve the with_defaults() fields up front so each call builds the
+    # context exactly once instead of replacing it twice.
+    rng = rng or random.Random()
+    if run_index is None:
+        run_index = rng.randint(0, 1_000_000)
+    return FuzzerContext(
+        phase=phase,
+        schema=schema,
+        key=key,
+        run_index=run_index,
+        rng=rng,
+        corpus_dir=corpus_dir,
+        havoc_mode=bool(havoc_mode) if havoc_mode is not None else False,
+        havoc_min=havoc_min if havoc_min is not None else 2,
+        havoc_max=havoc_max if havoc_max is not None else 6,
+    )
@@ -9,6 +9,7 @@ import copy
 import inspect
 import random
 from pathlib import Path
+from types import CodeType
 from typing import Any, Callable
 
 from .base import Mutator
@@ -18,6 +19,11 @@ from .seed_mutation import mutate_seed_payload
 from .utils import havoc_stack
 from .rng_context import fuzz_rng_scope
 
+# Whether a fuzzer method takes ``phase``, keyed by its code object. Strategy
+# lookups return a fresh closure per call, but closures built by the same
+# factory share one code object, so the signature only has to be read once.
+_ACCEPTS_PHASE: dict[CodeType, bool] = {}
+
 
 class ProtocolMutator(Mutator):
     """Generates fuzzed protocol messages."""
@@ -70,6 +76,8 @@ class ProtocolMutator(Mutator):
         self,
         protocol_type: str,
         phase: str = "aggressive",
+        *,
+        fuzzer_method: Callable[..., Any] | None = None,
     ) -> dict[str, Any]:
         """
         Generate fuzzed data for a protocol type.
@@ -77,6 +85,8 @@ class ProtocolMutator(Mutator):
         Args:
             protocol_type: Protocol type to fuzz
             phase: Fuzzing phase (realistic or aggressive)
+            fuzzer_method: Method already resolved by get_fuzzer_method for
+                this protocol type and phase; looked up when omitted
 
         Returns:
             Generated fuzz data
@@ -88,17 +98,14 @@ class ProtocolMutator(Mutator):
                     return self._mutate_from_seed(protocol_type, seed, phase)
 
         with fuzz_rng_scope(self._rng):
-            fuzzer_method = self.get_fuzzer_method(protocol_type, phase)
+            if fuzzer_method is None:
+                fuzzer_method = self.get_fuzzer_method(protocol_type, phase)
             if not fuzzer_method:
                 raise ValueError(
                     f"Unknown protocol type: {protocol_type} for phase: {phase}"
                 )
 
-            kwargs = (
-                {"phase": phase}
-                if "phase" in inspect.signature(fuzzer_method).parameters
-                else {}
-            )
+            kwargs = {"phase": phase} if _accepts_phase(fuzzer_method) else {}
 
             maybe_coro = fuzzer_method(**kwargs)
             if inspect.isawaitable(maybe_coro):
@@ -160,6 +167,18 @@ class ProtocolMutator(Mutator):
         )
 
 
+def _accepts_phase(fuzzer_method: Callable[..., Any]) -> bool:
+    code = getattr(fuzzer_method, "__code__", None)
+    # Wrapped callables report the wrapped signature, not their own code's.
+    if not isinstance(code, CodeType) or hasattr(fuzzer_method, "__wrapped__"):
+        return "phase" in inspect.signature(fuzzer_method).parameters
+    accepts = _ACCEPTS_PHASE.get(code)
+    if accepts is None:
+        accepts = "phase" in inspect.signature(fuzzer_method).parameters
+        _ACCEPTS_PHASE[code] = accepts
+    return accepts
+
+
 def _protocol_signature(
     server_error: str | None,
     spec_checks: list[dict[str, Any]] | None,
@@ -18,7 +18,7 @@ from typing import Any
 _logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeedEntry:
     """Stored seed entry with signature and score."""
 
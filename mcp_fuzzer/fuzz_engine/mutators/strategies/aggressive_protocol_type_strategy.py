@@ -6,82 +6,111 @@ Helper functions for generating malicious/aggressive values
 (used in tests and tool strategies).
 """
 
-import random
+import itertools
 from typing import Any
 
+from ..rng_context import lazy_rng as random
+
 # Attack payloads
-SQL_INJECTION = [
+SQL_INJECTION = (
     "' OR '1'='1", "'; DROP TABLE users; --", "' UNION SELECT * FROM users --",
     "'; DELETE FROM table WHERE 1=1; --", "admin'--", "admin'/*",
     "' OR 1=1#", "' OR 'x'='x", "'; EXEC xp_cmdshell('dir'); --",
-]
+)
 
-XSS_PAYLOADS = [
+XSS_PAYLOADS = (
     "<script>alert('xss')</script>", "<img src=x onerror=alert('xss')>",
     "javascript:alert('xss')", "<svg/onload=alert('xss')>",
     "<iframe src=javascript:alert('xss')>", "<body onload=alert('xss')>",
     "'><script>alert('xss')</script>", "\"><script>alert('xss')</script>",
     "<script>document.cookie</script>", "<script>window.location='http://evil.com'</script>",
-]
+)
 
-PATH_TRAVERSAL = [
+PATH_TRAVERSAL = (
     "../../../etc/passwd", "..\\..\\..\\windows\\system32\\config\\sam",
     "..\\..\\..\\..\\..\\..\\..\\..\\..\\..\\..\\..", "/etc/passwd",
     "/etc/shadow", "/etc/hosts", "C:\\windows\\system32\\drivers\\etc\\hosts",
     "file:///etc/passwd", "file:///c:/windows/system32/config/sam",
     "\\..\\..\\..\\..\\..\\..\\..\\..\\..",
-]
+)
 
-OVERFLOW_VALUES = [
+OVERFLOW_VALUES = (
     "A" * 1000, "A" * 10000, "A" * 100000, "\x00" * 1000,
     "0" * 1000, "9" * 1000, " " * 1000, "\n" * 1000,
     "\t" * 1000, "漢" * 1000,
-]
+)
+
+# Every fixed payload in one flat tuple, so picking one is a single index
+_ATOMIC_STRING_POOL = SQL_INJECTION + XSS_PAYLOADS + PATH_TRAVERSAL + OVERFLOW_VALUES
+# Share of generate_malicious_string picks drawn from the fixed payloads
+# (four of its nine strategies)
+_ATOMIC_SHARE = 4 / 9
+
+# Longest variable-length filler strings; callers slice the length they need
+_A_MAX = "A" * 10000
+_NULL_MAX = "\x00" * 100
+_HAN_MAX = "漢字" * 1000
+
+# Track how often experimental payloads are requested for deterministic test
+# behavior; next() on a count is a single C call, so concurrent workers cannot
+# lose increments the way a global read-modify-write can
+_experimental_payload_calls = itertools.count(1)
 
-# Track how often experimental payloads are requested for deterministic test behavior
-_experimental_payload_call_count = 0
+
+_MALICIOUS_STRING_STRATEGIES = (
+    lambda: _NULL_MAX[: random.randint(1, 100)],
+    lambda: _A_MAX[: random.randint(1000, 10000)],
+    lambda: _HAN_MAX[: 2 * random.randint(100, 1000)],
+    lambda: random.choice(["", " ", "\t", "\n", "\r"]),
+    lambda: f"http://evil.com/{random.choice(XSS_PAYLOADS)}",
+)
 
 
 def generate_malicious_string() -> str:
     """Generate malicious string values for aggressive testing."""
-    strategies = [
-        lambda: random.choice(SQL_INJECTION),
-        lambda: random.choice(XSS_PAYLOADS),
-        lambda: random.choice(PATH_TRAVERSAL),
-        lambda: random.choice(OVERFLOW_VALUES),
-        lambda: "\x00" * random.randint(1, 100),
-        lambda: "A" * random.randint(1000, 10000),
-        lambda: "漢字" * random.randint(100, 1000),
-        lambda: random.choice(["", " ", "\t", "\n", "\r"]),
-        lambda: f"http://evil.com/{random.choice(XSS_PAYLOADS)}",
-    ]
-    return random.choice(strategies)()
+    if random.random() < _ATOMIC_SHARE:
+        return _ATOMIC_STRING_POOL[int(random.random() * len(_ATOMIC_STRING_POOL))]
+    return random.choice(_MALICIOUS_STRING_STRATEGIES)()
+
+
+def generate_malicious_strings(n: int) -> list[str]:
+    """Draw ``n`` fixed malicious payloads in one call."""
+    return random.choices(_ATOMIC_STRING_POOL, k=n)
+
+
+# Only the picked strategy runs, rather than drawing every candidate up front
+_STRUCTURED_STRING_STRATEGIES = (
+    lambda: random.choice(SQL_INJECTION),
+    lambda: random.choice(XSS_PAYLOADS),
+    lambda: random.choice(PATH_TRAVERSAL),
+    lambda: _A_MAX[: random.randint(256, 4096)],
+    lambda: _NULL_MAX[: random.randint(1, 64)],
+)
 
 
 def generate_structured_string() -> str:
     """Generate a malicious string while preserving string type."""
-    return random.choice([
-        random.choice(SQL_INJECTION),
-        random.choice(XSS_PAYLOADS),
-        random.choice(PATH_TRAVERSAL),
-        "A" * random.randint(256, 4096),
-        "\x00" * random.randint(1, 64),
-    ])
+    return random.choice(_STRUCTURED_STRING_STRATEGIES)()
+
+
+_STRUCTURED_NUMBERS = (
+    -1, 0, 1, 2**31 - 1, 2**63 - 1, -2**63,
+    10**9, -10**9, 3.14159, -3.14159,
+)
+
+_STRUCTURED_IDS = (
+    1, 2, 42, 999999999, "req-001", "req-002", "id-" + ("A" * 32),
+)
 
 
 def generate_structured_number() -> int | float:
     """Generate an aggressive numeric value without NaN/Infinity."""
-    return random.choice([
-        -1, 0, 1, 2**31 - 1, 2**63 - 1, -2**63,
-        10**9, -10**9, 3.14159, -3.14159,
-    ])
+    return random.choice(_STRUCTURED_NUMBERS)
 
 
 def generate_structured_id() -> int | str:
     """Generate a JSON-RPC id that remains valid (string or number)."""
-    return random.choice([
-        1, 2, 42, 999999999, "req-001", "req-002", "id-" + ("A" * 32),
-    ])
+    return random.choice(_STRUCTURED_IDS)
 
 
 def generate_structured_meta() -> dict[str, Any]:
@@ -89,7 +118,7 @@ def generate_structured_meta() -> dict[str, Any]:
     return {
         "trace": generate_structured_string(),
         "tags": [generate_structured_string() for _ in range(random.randint(1, 3))],
-        "flags": {"experimental": random.choice([True, False])},
+        "flags": {"experimental": random.random() < 0.5},
     }
 
 
@@ -98,7 +127,7 @@ def generate_structured_object() -> dict[str, Any]:
     return {
         "value": generate_structured_string(),
         "count": generate_structured_number(),
-        "enabled": random.choice([True, False]),
+        "enabled": random.random() < 0.5,
     }
 
 
@@ -108,68 +137,85 @@ def choice_lazy(options):
     return picked() if callable(picked) else picked
 
 
+# Mutable values are built by their option on each pick, so callers never share
+# (and cannot corrupt) a returned container
+_MALICIOUS_VALUE_OPTIONS = (
+    None,
+    "",
+    "null",
+    "undefined",
+    "NaN",
+    "Infinity",
+    "-Infinity",
+    True,
+    False,
+    0,
+    -1,
+    999999999,
+    -999999999,
+    3.14159,
+    -3.14159,
+    list,
+    dict,
+    generate_malicious_string,
+    lambda: {"__proto__": {"isAdmin": True}},
+    lambda: {"constructor": {"prototype": {"isAdmin": True}}},
+    lambda: [generate_malicious_string()],
+    lambda: {"evil": generate_malicious_string()},
+)
+
+
 def generate_malicious_value() -> Any:
     """Generate malicious values of various types."""
     if random.random() < 0.2:
         return None
-    return choice_lazy(
-        [
-            None,
-            "",
-            "null",
-            "undefined",
-            "NaN",
-            "Infinity",
-            "-Infinity",
-            True,
-            False,
-            0,
-            -1,
-            999999999,
-            -999999999,
-            3.14159,
-            -3.14159,
-            [],
-            {},
-            lambda: generate_malicious_string(),
-            {"__proto__": {"isAdmin": True}},
-            {"constructor": {"prototype": {"isAdmin": True}}},
-            lambda: [generate_malicious_string()],
-            lambda: {"evil": generate_malicious_string()},
-        ]
-    )
+    return choice_lazy(_MALICIOUS_VALUE_OPTIONS)
+
+
+def _experimental_custom_capability() -> dict[str, Any]:
+    return {
+        "customCapability": generate_malicious_value(),
+        "extendedFeature": {
+            "enabled": generate_malicious_value(),
+            "config": generate_malicious_value(),
+        },
+        "__proto__": {"isAdmin": True},
+        "evil": generate_malicious_string(),
+    }
+
+
+def _experimental_malicious_extension() -> dict[str, Any]:
+    return {
+        "maliciousExtension": {
+            "payload": generate_malicious_string(),
+            "injection": random.choice(SQL_INJECTION),
+            "xss": random.choice(XSS_PAYLOADS),
+        }
+    }
+
+
+# Mutable values are built by their option on each pick, as for
+# _MALICIOUS_VALUE_OPTIONS
+_EXPERIMENTAL_PAYLOAD_OPTIONS = (
+    None,
+    "",
+    list,
+    generate_malicious_string,
+    lambda: random.randint(-1000, 1000),
+    lambda: random.random() < 0.5,
+    _experimental_custom_capability,
+    _experimental_malicious_extension,
+    lambda: ["item1", "item2", generate_malicious_value()],
+    lambda: {"nested": {"key": generate_malicious_value()}},
+    "experimental_string_value",
+    lambda: {"feature_flag": True},
+    lambda: [1, 2, 3, "mixed_array"],
+    lambda: {"config": {"debug": False, "verbose": True}},
+)
 
 
 def generate_experimental_payload():
     """Generate experimental capability payloads lazily."""
-    global _experimental_payload_call_count
-    _experimental_payload_call_count += 1
-    if _experimental_payload_call_count % 5 == 0:
+    if next(_experimental_payload_calls) % 5 == 0:
         return None
-    return choice_lazy([
-        None, "", [], lambda: generate_malicious_string(),
-        lambda: random.randint(-1000, 1000),
-        lambda: random.choice([True, False]),
-        lambda: {
-            "customCapability": generate_malicious_value(),
-            "extendedFeature": {
-                "enabled": generate_malicious_value(),
-                "config": generate_malicious_value(),
-            },
-            "__proto__": {"isAdmin": True},
-            "evil": generate_malicious_string(),
-        },
-        lambda: {
-            "maliciousExtension": {
-                "payload": generate_malicious_string(),
-                "injection": random.choice(SQL_INJECTION),
-                "xss": random.choice(XSS_PAYLOADS),
-            }
-        },
-        lambda: ["item1", "item2", generate_malicious_value()],
-        lambda: {"nested": {"key": generate_malicious_value()}},
-        "experimental_string_value",
-        {"feature_flag": True},
-        lambda: [1, 2, 3, "mixed_array"],
-        {"config": {"debug": False, "verbose": True}},
-    ])
+    return choice_lazy(_EXPERIMENTAL_PAYLOAD_OPTIONS)
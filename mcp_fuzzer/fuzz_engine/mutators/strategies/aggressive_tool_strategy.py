@@ -15,6 +15,8 @@ Key principles:
 """
 
 from ..rng_context import lazy_rng as random
+from functools import lru_cache
+import re
 import string
 from typing import Any
 
@@ -42,6 +44,52 @@ HTML_ENTITIES = ["&lt;", "&gt;", "&amp;", "&quot;", "&#x27;", "&#x2F;"]
 MIN_TOKENS = ("min", "lower", "start")
 MAX_TOKENS = ("max", "upper", "limit", "size", "count", "timeout")
 
+# Field-name hints per payload picker, checked in order: the first group with
+# a token contained in the lowercased name picks the payload family.
+_HINTS: dict[str, tuple[tuple[str, tuple[str, ...]], ...]] = {
+    "text": (
+        ("ssrf", ("uri", "url", "href", "link")),
+        ("path", ("path", "file", "dir", "folder")),
+        ("sql", ("query", "search", "sql", "filter")),
+        ("nosql", ("mongo", "nosql")),
+        ("xss", ("html", "content", "body", "text")),
+        ("command", ("cmd", "command", "exec", "shell")),
+    ),
+    "semantic_string": (
+        ("ssrf", ("uri", "url", "href")),
+        ("path", ("path", "file", "dir", "folder")),
+        ("sql", ("query", "search", "filter", "sql")),
+        ("xss", ("html", "content", "body", "text")),
+        ("command", ("cmd", "command", "exec", "shell")),
+        ("id", ("id", "name", "key", "cursor")),
+    ),
+    "semantic_number": (
+        ("min", MIN_TOKENS),
+        ("max", MAX_TOKENS),
+    ),
+}
+# Each group compiled to one alternation so a name is scanned once per group
+_HINT_PATTERNS: dict[str, tuple[tuple[str, re.Pattern[str]], ...]] = {
+    picker: tuple(
+        (kind, re.compile("|".join(map(re.escape, tokens))))
+        for kind, tokens in groups
+    )
+    for picker, groups in _HINTS.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def _match_hint(name: str, picker: str) -> str | None:
+    """Return the first ``picker`` hint group matching ``name``.
+
+    Cached because the same schema field names recur on every fuzz run.
+    """
+    lowered = name.lower()
+    for kind, pattern in _HINT_PATTERNS[picker]:
+        if pattern.search(lowered):
+            return kind
+    return None
+
 
 def generate_aggressive_text(
     min_size: int = 1,
@@ -117,20 +165,19 @@ def generate_aggressive_text(
         return value
 
     # Use semantic hints from key name
-    if key:
-        lowered = key.lower()
-        if any(x in lowered for x in ("uri", "url", "href", "link")):
-            return _fit_to_length(random.choice(SSRF_PAYLOADS))
-        if any(x in lowered for x in ("path", "file", "dir", "folder")):
-            return _fit_to_length(random.choice(PATH_TRAVERSAL))
-        if any(x in lowered for x in ("query", "search", "sql", "filter")):
-            return _fit_to_length(get_payload_within_length(max_size, "sql"))
-        if any(x in lowered for x in ("mongo", "nosql")):
-            return _fit_to_length(random.choice(NOSQL_INJECTION))
-        if any(x in lowered for x in ("html", "content", "body", "text")):
-            return _fit_to_length(get_payload_within_length(max_size, "xss"))
-        if any(x in lowered for x in ("cmd", "command", "exec", "shell")):
-            return _fit_to_length(random.choice(COMMAND_INJECTION))
+    hint = _match_hint(key, "text") if key else None
+    if hint == "ssrf":
+        return _fit_to_length(random.choice(SSRF_PAYLOADS))
+    if hint == "path":
+        return _fit_to_length(random.choice(PATH_TRAVERSAL))
+    if hint == "sql":
+        return _fit_to_length(get_payload_within_length(max_size, "sql"))
+    if hint == "nosql":
+        return _fit_to_length(random.choice(NOSQL_INJECTION))
+    if hint == "xss":
+        return _fit_to_length(get_payload_within_length(max_size, "xss"))
+    if hint == "command":
+        return _fit_to_length(random.choice(COMMAND_INJECTION))
 
     if strategy == "sql_injection":
         return _fit_to_length(random.choice(SQL_INJECTION))
@@ -439,29 +486,29 @@ def _pick_semantic_string(name: str, max_length: int | None = None) -> str:
     """
     max_len = max_length if max_length is not None else 100
 
-    lowered = name.lower()
+    hint = _match_hint(name, "semantic_string")
 
-    if any(token in lowered for token in ("uri", "url", "href")):
+    if hint == "ssrf":
         payload = random.choice(SSRF_PAYLOADS)
         return _clamp_string(payload, 0, max_len)
 
-    if any(token in lowered for token in ("path", "file", "dir", "folder")):
+    if hint == "path":
         payload = get_payload_within_length(max_len, "path")
         return _clamp_string(payload, 0, max_len)
 
-    if any(token in lowered for token in ("query", "search", "filter", "sql")):
+    if hint == "sql":
         payload = get_payload_within_length(max_len, "sql")
         return _clamp_string(payload, 0, max_len)
 
-    if any(token in lowered for token in ("html", "content", "body", "text")):
+    if hint == "xss":
         payload = get_payload_within_length(max_len, "xss")
         return _clamp_string(payload, 0, max_len)
 
-    if any(token in lowered for token in ("cmd", "command", "exec", "shell")):
+    if hint == "command":
         payload = random.choice(COMMAND_INJECTION)
         return _clamp_string(payload, 0, max_len)
 
-    if any(token in lowered for token in ("id", "name", "key", "cursor")):
+    if hint == "id":
         # Use unicode trick or type confusion instead of garbage
         base = "test_id"
         payload = inject_unicode_trick(base, max_len)
@@ -478,18 +525,18 @@ def _pick_semantic_number(name: str, spec: dict[str, Any]) -> int | float:
 
     Prioritizes off-by-one violations when constraints exist.
     """
-    lowered = name.lower()
+    hint = _match_hint(name, "semantic_number")
     minimum = spec.get("minimum")
     maximum = spec.get("maximum")
 
     # For "min" fields, try to go below minimum
-    if any(token in lowered for token in MIN_TOKENS):
+    if hint == "min":
         if minimum is not None:
             return minimum - 1  # Off-by-one below
         return -1
 
     # For "max" fields, try to exceed maximum
-    if any(token in lowered for token in MAX_TOKENS):
+    if hint == "max":
         if maximum is not None:
             return maximum + 1  # Off-by-one above
         return 2147483648  # INT32_MAX + 1
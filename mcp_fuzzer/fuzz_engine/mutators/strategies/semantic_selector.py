@@ -17,6 +17,9 @@ from .interesting_values import (
 )
 from .utils import ConstraintMode, fit_to_constraints
 
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]+")
+
 
 class SemanticPayloadSelector:
     """Select payloads based on normalized token matching."""
@@ -29,8 +32,8 @@ class SemanticPayloadSelector:
         if not key:
             return set()
         # Normalize camelCase to tokens, then split on non-alnum.
-        normalized = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", key)
-        tokens = re.split(r"[^a-zA-Z0-9]+", normalized.lower())
+        normalized = _CAMEL_BOUNDARY.sub(r"\1 \2", key)
+        tokens = _NON_ALNUM.split(normalized.lower())
         return {t for t in tokens if t}
 
     def pick_string(
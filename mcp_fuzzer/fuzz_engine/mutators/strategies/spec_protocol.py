@@ -14,6 +14,7 @@ import random as _stdlib_random
 
 from ..rng_context import get_fuzz_rng, lazy_rng
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
@@ -24,11 +25,17 @@ from .schema_parser import make_fuzz_strategy_from_jsonschema
 random = lazy_rng
 
 _SCHEMA_CACHE: dict[str, dict[str, Any]] = {}
+# Resolved definitions keyed by the identity of the loaded schema. Each entry
+# holds the schema itself, so its id cannot be recycled while the entry is alive.
+_DEFINITION_CACHE: dict[
+    int, tuple[dict[str, Any], dict[str, dict[str, Any] | None]]
+] = {}
 
 
 def clear_schema_cache() -> None:
     """Clear the in-memory schema cache."""
     _SCHEMA_CACHE.clear()
+    _DEFINITION_CACHE.clear()
 
 
 def _schema_version_or_env(version: str | None) -> str | None:
@@ -57,6 +64,7 @@ MALICIOUS_NUMBERS = [
     -999999999,
 ]
 
+@lru_cache(maxsize=1)
 def _repo_root() -> Path:
     current = Path(__file__).resolve()
     for parent in current.parents:
@@ -149,6 +157,20 @@ def _definition_for(protocol_type: str, version: str | None) -> dict[str, Any] |
     schema = _load_schema(version)
     if not schema:
         return None
+    # Both the fuzzer lookup and every built request need the definition, so
+    # resolve each one once per loaded schema instead of on every call
+    entry = _DEFINITION_CACHE.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = _DEFINITION_CACHE[id(schema)] = (schema, {})
+    resolved = entry[1]
+    if protocol_type not in resolved:
+        resolved[protocol_type] = _resolve_definition(schema, protocol_type)
+    return resolved[protocol_type]
+
+
+def _resolve_definition(
+    schema: dict[str, Any], protocol_type: str
+) -> dict[str, Any] | None:
     definitions = schema.get("definitions")
     if not isinstance(definitions, dict):
         definitions = schema.get("$defs", {})
@@ -13,7 +13,7 @@ from ..reports import FuzzerReporter
 from .models import SessionContext
 
 
-@dataclass
+@dataclass(slots=True)
 class RunPlan:
     """Explicit list of commands to execute for a given mode."""
 
@@ -116,38 +116,25 @@ class StatefulCommand:
         context.protocol_results.update(await pipeline.fuzz_stateful())
 
 
+# Commands carry no per-run state, so every plan can share these instances.
+_MODE_STEPS: dict[str, tuple[RunCommand, ...]] = {
+    "all": (ToolsCommand(), SpecGuardCommand(), ProtocolCommand()),
+    "protocol": (SpecGuardCommand(), ProtocolCommand()),
+    "resources": (SpecGuardCommand(), ResourcesCommand()),
+    "prompts": (SpecGuardCommand(), PromptsCommand()),
+    "tools": (ToolsCommand(),),
+}
+_STATEFUL_STEP = StatefulCommand()
+
+
 def build_run_plan(mode: str, config: dict[str, Any]) -> RunPlan:
-    steps: list[RunCommand] = []
-    supported_modes = {"all", "protocol", "resources", "prompts", "tools"}
-    if mode not in supported_modes:
+    base_steps = _MODE_STEPS.get(mode)
+    if base_steps is None:
         raise ValueError(f"Unsupported mode: {mode}")
 
-    if mode == "all":
-        steps.append(ToolsCommand())
-        steps.append(SpecGuardCommand())
-        steps.append(ProtocolCommand())
-        if config.get("stateful", False):
-            steps.append(StatefulCommand())
-        return RunPlan(steps)
-
-    if mode in {"protocol", "resources", "prompts"}:
-        steps.append(SpecGuardCommand())
-
-    if mode == "tools":
-        steps.append(ToolsCommand())
-    elif mode == "protocol":
-        steps.append(ProtocolCommand())
-        if config.get("stateful", False):
-            steps.append(StatefulCommand())
-    elif mode == "resources":
-        steps.append(ResourcesCommand())
-        if config.get("stateful", False):
-            steps.append(StatefulCommand())
-    elif mode == "prompts":
-        steps.append(PromptsCommand())
-        if config.get("stateful", False):
-            steps.append(StatefulCommand())
-
+    steps: list[RunCommand] = list(base_steps)
+    if mode != "tools" and config.get("stateful", False):
+        steps.append(_STATEFUL_STEP)
     return RunPlan(steps)
 
 
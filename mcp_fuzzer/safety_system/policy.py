@@ -153,7 +153,7 @@ def sanitize_subprocess_env(
     Removes proxy-related environment variables to avoid accidental egress via proxies.
     """
     env = dict(source_env or os.environ)
-    deny = set(proxy_denylist or SAFETY_PROXY_ENV_DENYLIST)
+    deny = frozenset(proxy_denylist) if proxy_denylist else SAFETY_PROXY_ENV_DENYLIST
     deny_lower = {k.lower() for k in deny}
     for key in list(env.keys()):
         if key in deny or key.lower() in deny_lower:
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 AUTH_PROTOCOLS = ("http", "https", "streamablehttp", "sse")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransportBuildRequest:
     """Typed transport settings used by the client runtime."""
 
@@ -87,11 +87,11 @@ def build_driver_with_auth(request: TransportBuildRequest):
 
         if resolved.protocol in AUTH_PROTOCOLS:
             factory_kwargs["safety_enabled"] = safety_enabled
-        if resolved.protocol in AUTH_PROTOCOLS and auth_header_provider:
-            factory_kwargs["auth_header_provider"] = auth_header_provider
-            logger.debug(
-                "Adding auth provider to %s transport", resolved.protocol.upper()
-            )
+            if auth_header_provider:
+                factory_kwargs["auth_header_provider"] = auth_header_provider
+                logger.debug(
+                    "Adding auth provider to %s transport", resolved.protocol.upper()
+                )
 
         logger.debug(
             "Creating %s transport to %s",
@@ -55,6 +55,11 @@ from ..methods import (
     payload_method,
 )
 from ..protocol import ProtocolNegotiationState, negotiated_headers
+from ..retrying import RetryPolicy
+
+# Backoff for the driver's own connection retries; RetryPolicy supplies the
+# same capped, jittered delays RetryingTransport uses
+_RETRY_POLICY = RetryPolicy(base_delay=RETRY_DELAY)
 
 
 class StreamHttpDriver(TransportDriver, HttpClientBehavior, ResponseParserBehavior):
@@ -349,7 +354,6 @@ class StreamHttpDriver(TransportDriver, HttpClientBehavior, ResponseParserBehavi
         Raises:
             TransportError: If all retries fail
         """
-        delay = RETRY_DELAY
         attempt = 0
         while True:
             try:
@@ -384,8 +388,7 @@ class StreamHttpDriver(TransportDriver, HttpClientBehavior, ResponseParserBehavi
                     url,
                     type(e).__name__,
                 )
-                await asyncio.sleep(delay)
-                delay *= 2
+                await asyncio.sleep(_RETRY_POLICY.delay_for(attempt + 1))
                 attempt += 1
 
     async def _get_with_retries(
@@ -396,7 +399,6 @@ class StreamHttpDriver(TransportDriver, HttpClientBehavior, ResponseParserBehavi
         retries: int = 2,
     ) -> httpx.Response:
         """GET with exponential backoff for transient network errors."""
-        delay = RETRY_DELAY
         attempt = 0
         while True:
             try:
@@ -416,8 +418,7 @@ class StreamHttpDriver(TransportDriver, HttpClientBehavior, ResponseParserBehavi
                             "url": url,
                         },
                     ) from e
-                await asyncio.sleep(delay)
-                delay *= 2
+                await asyncio.sleep(_RETRY_POLICY.delay_for(attempt + 1))
                 attempt += 1
 
     async def send_request(
@@ -12,7 +12,7 @@ from ..exceptions import PayloadValidationError, TransportError
 from .interfaces.driver import TransportDriver
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryPolicy:
     """Simple retry policy for transport requests."""
 
@@ -32,6 +32,15 @@ class RetryPolicy:
             jitter=max(0.0, float(self.jitter)),
         )
 
+    def delay_for(self, attempt: int) -> float:
+        """Return the jittered backoff before retry ``attempt`` (1-based)."""
+        delay = self.base_delay * (self.backoff_factor ** (attempt - 1))
+        delay = min(delay, self.max_delay)
+        if self.jitter:
+            jitter = delay * self.jitter
+            delay += random.uniform(-jitter, jitter)
+        return max(delay, 0.0)
+
 
 class RetryingTransport(TransportDriver):
     """Transport wrapper that retries transient failures."""
@@ -56,12 +65,7 @@ class RetryingTransport(TransportDriver):
         return isinstance(exc, self._retry_on)
 
     def _next_delay(self, attempt: int) -> float:
-        delay = self._policy.base_delay * (self._policy.backoff_factor ** (attempt - 1))
-        delay = min(delay, self._policy.max_delay)
-        if self._policy.jitter:
-            jitter = delay * self._policy.jitter
-            delay += random.uniform(-jitter, jitter)
-        return max(delay, 0.0)
+        return self._policy.delay_for(attempt)
 
     async def _with_retries(self, coro_factory, label: str) -> Any:
         attempts = self._policy.max_attempts
@@ -3,6 +3,7 @@
 Unit tests for ProtocolClient.
 """
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -764,3 +765,22 @@ class TestShutdown:
         """Test shutdown returns None."""
         result = await client.shutdown()
         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_caps_in_flight_runs_and_keeps_order():
+    client = ProtocolClient(transport=MagicMock(), safety_system=None)
+    client.max_concurrency = 2
+    in_flight = 0
+    peak = 0
+
+    async def factory(index):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (index % 3))
+        in_flight -= 1
+        return index
+
+    assert await client._run_bounded(7, factory) == list(range(7))
+    assert peak == 2
@@ -208,6 +208,69 @@ async def test_fuzz_tool_both_phases_runs():
     assert result["aggressive"] == [{"ok": False}]
 
 
+@pytest.mark.asyncio
+async def test_fuzz_tool_both_phases_overlaps_phase_boundary():
+    """Aggressive runs start while a slow realistic run is still in flight."""
+    client, _ = _make_client()
+    client.max_concurrency = 2
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def fake_mutate(_tool, phase="aggressive"):
+        order.append(phase)
+        if phase == "realistic" and order.count("realistic") == 1:
+            await release.wait()
+        elif phase == "aggressive":
+            release.set()
+        return {"phase": phase}
+
+    client.tool_mutator.mutate = fake_mutate
+    client._execute_tool_call = AsyncMock(
+        side_effect=lambda _name, args, **_kwargs: args
+    )
+
+    result = await asyncio.wait_for(
+        client.fuzz_tool_both_phases({"name": "alpha"}, runs_per_phase=2),
+        timeout=1.0,
+    )
+
+    assert order[:3] == ["realistic", "realistic", "aggressive"]
+    assert result["realistic"] == [{"phase": "realistic"}] * 2
+    assert result["aggressive"] == [{"phase": "aggressive"}] * 2
+
+
+@pytest.mark.asyncio
+async def test_fuzz_tool_both_phases_logs_phase_at_its_first_run():
+    """Each phase is logged when its first run starts, not up front."""
+    client, _ = _make_client()
+    client.max_concurrency = 1
+    events: list[str] = []
+
+    async def fake_mutate(_tool, phase="aggressive"):
+        events.append(f"run:{phase}")
+        return {"phase": phase}
+
+    client.tool_mutator.mutate = fake_mutate
+    client._execute_tool_call = AsyncMock(
+        side_effect=lambda _name, args, **_kwargs: args
+    )
+    client._logger = MagicMock()
+    client._logger.info.side_effect = lambda msg, *args: (
+        events.append(f"log:{args[0]}") if msg == "%s phase: %s" else None
+    )
+
+    await client.fuzz_tool_both_phases({"name": "alpha"}, runs_per_phase=2)
+
+    assert events == [
+        "log:Realistic",
+        "run:realistic",
+        "run:realistic",
+        "log:Aggressive",
+        "run:aggressive",
+        "run:aggressive",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_fuzz_tool_both_phases_forwards_tool_timeout():
     client = ToolClient(
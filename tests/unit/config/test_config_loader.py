@@ -258,3 +258,46 @@ def test_config_loader_apply_from_params():
     result = loader.apply_from_params(params)
     assert result is True
     mock_config.update.assert_called_once_with({"log_level": "DEBUG"})
+
+
+def test_config_loader_apply_skips_unchanged_file(config_files):
+    """Re-applying an unchanged file with no writes in between is a no-op."""
+    cfg = Configuration()
+    parser = Mock(side_effect=load_config_file)
+    loader = ConfigLoader(parser=parser, transport_loader=Mock(), config_instance=cfg)
+    assert loader.apply(config_path=config_files["yaml_path"]) is True
+    assert loader.apply(config_path=config_files["yaml_path"]) is True
+    assert parser.call_count == 1
+    assert cfg.get("timeout") == 60.0
+
+
+def test_config_loader_apply_reapplies_after_writes_or_edits(config_files):
+    """Later writes or a modified file force the file to be applied again."""
+    cfg = Configuration()
+    path = config_files["yaml_path"]
+    loader = ConfigLoader(transport_loader=Mock(), config_instance=cfg)
+    assert loader.apply(config_path=path) is True
+
+    cfg.set("timeout", 1.0)
+    assert loader.apply(config_path=path) is True
+    assert cfg.get("timeout") == 60.0
+
+    Path(path).write_text("timeout: 75.0\n")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert loader.apply(config_path=path) is True
+    assert cfg.get("timeout") == 75.0
+
+
+def test_config_loader_apply_propagates_unexpected_errors():
+    """Programming errors are not swallowed as a failed apply."""
+    mock_config = Mock(spec=Configuration)
+    loader = ConfigLoader(
+        discoverer=lambda *_: "config.yaml",
+        parser=Mock(side_effect=TypeError("bug")),
+        transport_loader=Mock(),
+        config_instance=mock_config,
+    )
+    with pytest.raises(TypeError, match="bug"):
+        loader.apply()
+    mock_config.update.assert_not_called()
@@ -52,14 +52,14 @@ def test_safety_local_hosts():
     assert "localhost" in SAFETY_LOCAL_HOSTS
     assert "127.0.0.1" in SAFETY_LOCAL_HOSTS
     assert "::1" in SAFETY_LOCAL_HOSTS
-    assert isinstance(SAFETY_LOCAL_HOSTS, set)
+    assert isinstance(SAFETY_LOCAL_HOSTS, frozenset)
 
 
 def test_safety_header_denylist():
     """Test that SAFETY_HEADER_DENYLIST contains sensitive headers."""
     assert "authorization" in SAFETY_HEADER_DENYLIST
     assert "cookie" in SAFETY_HEADER_DENYLIST
-    assert isinstance(SAFETY_HEADER_DENYLIST, set)
+    assert isinstance(SAFETY_HEADER_DENYLIST, frozenset)
 
 
 def test_safety_proxy_env_denylist():
@@ -75,12 +75,12 @@ def test_safety_proxy_env_denylist():
         "no_proxy",
     }
     assert expected_vars.issubset(SAFETY_PROXY_ENV_DENYLIST)
-    assert isinstance(SAFETY_PROXY_ENV_DENYLIST, set)
+    assert isinstance(SAFETY_PROXY_ENV_DENYLIST, frozenset)
 
 
 def test_safety_env_allowlist():
     """Test that SAFETY_ENV_ALLOWLIST is a set."""
-    assert isinstance(SAFETY_ENV_ALLOWLIST, set)
+    assert isinstance(SAFETY_ENV_ALLOWLIST, frozenset)
 
 
 def test_default_timeout_values():
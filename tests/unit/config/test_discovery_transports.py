@@ -88,6 +88,24 @@ def test_find_config_file_returns_none_when_missing(tmp_path):
     assert find_config_file(search_paths=[str(tmp_path)]) is None
 
 
+def test_find_config_file_skips_directories_and_missing_paths(tmp_path):
+    """Non-file matches and nonexistent search paths should be skipped."""
+    (tmp_path / "first").mkdir()
+    (tmp_path / "first" / "mcp-fuzzer.yml").mkdir()
+    (tmp_path / "second").mkdir()
+    path = tmp_path / "second" / "mcp-fuzzer.yml"
+    path.write_text("timeout: 10\n")
+    result = find_config_file(
+        search_paths=[
+            str(tmp_path / "missing"),
+            str(tmp_path / "first"),
+            str(tmp_path / "second"),
+        ],
+        file_names=["mcp-fuzzer.yml"],
+    )
+    assert result == str(path)
+
+
 def test_load_custom_transports_registers_transport():
     """Valid transport entry should be registered in the custom registry."""
     config_data = {
@@ -253,3 +271,40 @@ def test_load_custom_transports_non_callable_factory(monkeypatch):
 
     with pytest.raises(ConfigFileError, match="not callable"):
         load_custom_transports(config_data)
+
+
+def test_load_custom_transports_imports_shared_module_once(monkeypatch):
+    from mcp_fuzzer.config import transports
+
+    dummy_module = SimpleNamespace(DummyTransport=DummyTransport)
+    imported: list[str] = []
+
+    def fake_import(name):
+        imported.append(name)
+        return dummy_module
+
+    monkeypatch.setattr(transports.importlib, "import_module", fake_import)
+
+    config_data = {
+        "custom_transports": {
+            "first": {"module": "dummy_module", "class": "DummyTransport"},
+            "second": {"module": "dummy_module", "class": "DummyTransport"},
+        }
+    }
+
+    load_custom_transports(config_data)
+    assert imported == ["dummy_module"]
+
+
+def test_find_config_file_defaults_follow_cwd(tmp_path, monkeypatch):
+    """Default search re-reads the working directory on every call."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (second / "mcp-fuzzer.yaml").write_text("timeout: 1\n")
+
+    monkeypatch.chdir(first)
+    find_config_file()
+    monkeypatch.chdir(second)
+    assert find_config_file() == os.path.join(str(second), "mcp-fuzzer.yaml")
@@ -10,51 +10,45 @@ import pytest
 
 from mcp_fuzzer.config.manager import (
     Configuration,
-    _get_bool_from_env,
-    _get_float_from_env,
+    _parse_bool,
+    _parse_float,
     config,
 )
 
 
-def test_get_float_from_env_with_value():
-    """Test _get_float_from_env with valid environment variable."""
-    with patch.dict(os.environ, {"TEST_FLOAT": "42.5"}):
-        assert _get_float_from_env("TEST_FLOAT", 0.0) == 42.5
+def test_parse_float_with_value():
+    """Test _parse_float with a valid value."""
+    assert _parse_float("42.5", 0.0) == 42.5
 
 
-def test_get_float_from_env_with_default():
-    """Test _get_float_from_env when variable is not set."""
-    with patch.dict(os.environ, {}, clear=True):
-        assert _get_float_from_env("TEST_FLOAT", 10.0) == 10.0
+def test_parse_float_with_default():
+    """Test _parse_float when the variable is not set."""
+    assert _parse_float(None, 10.0) == 10.0
 
 
-def test_get_float_from_env_with_invalid_value():
-    """Test _get_float_from_env with invalid value falls back to default."""
-    with patch.dict(os.environ, {"TEST_FLOAT": "not_a_number"}):
-        assert _get_float_from_env("TEST_FLOAT", 5.0) == 5.0
+def test_parse_float_with_invalid_value():
+    """Test _parse_float with an invalid value falls back to default."""
+    assert _parse_float("not_a_number", 5.0) == 5.0
 
 
-def test_get_bool_from_env_true_values():
-    """Test _get_bool_from_env with various true values."""
+def test_parse_bool_true_values():
+    """Test _parse_bool with various true values."""
     true_values = ["1", "true", "True", "TRUE", "yes", "YES", "on", "ON"]
     for val in true_values:
-        with patch.dict(os.environ, {"TEST_BOOL": val}):
-            assert _get_bool_from_env("TEST_BOOL", False) is True
+        assert _parse_bool(val, False) is True
 
 
-def test_get_bool_from_env_false_values():
-    """Test _get_bool_from_env with false values."""
+def test_parse_bool_false_values():
+    """Test _parse_bool with false values."""
     false_values = ["0", "false", "no", "off", "anything_else"]
     for val in false_values:
-        with patch.dict(os.environ, {"TEST_BOOL": val}):
-            assert _get_bool_from_env("TEST_BOOL", True) is False
+        assert _parse_bool(val, True) is False
 
 
-def test_get_bool_from_env_with_default():
-    """Test _get_bool_from_env when variable is not set."""
-    with patch.dict(os.environ, {}, clear=True):
-        assert _get_bool_from_env("TEST_BOOL", True) is True
-        assert _get_bool_from_env("TEST_BOOL", False) is False
+def test_parse_bool_with_default():
+    """Test _parse_bool when the variable is not set."""
+    assert _parse_bool(None, True) is True
+    assert _parse_bool(None, False) is False
 
 
 def test_configuration_loads_from_env():
@@ -88,6 +82,23 @@ def test_configuration_uses_defaults():
         assert cfg.get("safety_enabled") is False
 
 
+def test_configuration_env_defaults_are_isolated_between_instances():
+    """Instances seeded from the same env snapshot must not share state."""
+    with patch.dict(os.environ, {"MCP_FUZZER_TIMEOUT": "12.0"}):
+        first = Configuration()
+        first.set("timeout", 99.0)
+        second = Configuration()
+    assert second.get("timeout") == 12.0
+
+
+def test_configuration_env_defaults_follow_env_changes():
+    """A changed environment is re-parsed rather than served from cache."""
+    with patch.dict(os.environ, {"MCP_FUZZER_TIMEOUT": "12.0"}):
+        assert Configuration().get("timeout") == 12.0
+    with patch.dict(os.environ, {"MCP_FUZZER_TIMEOUT": "13.0"}):
+        assert Configuration().get("timeout") == 13.0
+
+
 def test_configuration_get_with_default():
     """Test Configuration.get() with custom default."""
     cfg = Configuration()
@@ -115,3 +126,15 @@ def test_global_config_instance():
     assert isinstance(config, Configuration)
     # Should have default values
     assert config.get("timeout") is not None
+
+
+def test_configuration_snapshot_is_read_only_and_stable():
+    """Snapshots are immutable and unaffected by later writes."""
+    cfg = Configuration()
+    cfg.set("key", "before")
+    snapshot = cfg.snapshot()
+    with pytest.raises(TypeError):
+        snapshot["key"] = "mutated"  # type: ignore[index]
+    cfg.update({"key": "after"})
+    assert snapshot["key"] == "before"
+    assert cfg.get("key") == "after"
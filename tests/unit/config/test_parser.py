@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -51,26 +52,33 @@ def test_load_config_file_permission_error(tmp_path):
     config_path = tmp_path / "test.yaml"
     config_path.write_text("timeout: 30")
 
-    with patch("builtins.open", side_effect=PermissionError("Access denied")):
+    with patch("os.open", side_effect=PermissionError("Access denied")):
         with pytest.raises(ConfigFileError, match="Permission denied"):
             load_config_file(str(config_path))
 
 
-def test_load_config_file_exception_formatting():
+def test_load_config_file_exception_formatting(tmp_path):
     """Test exceptions formatted without redundant str() conversion."""
-    config_path = "/test/path.yaml"
+    config_path = tmp_path / "path.yaml"
+    config_path.write_text("invalid: yaml: [")
 
-    # Mock file exists check
-    with patch("os.path.isfile", return_value=True):
-        # Mock YAML parsing error
-        yaml_error = yaml.YAMLError("YAML syntax error")
-        with patch("builtins.open", mock_open(read_data="invalid: yaml: [")):
-            with patch("yaml.safe_load", side_effect=yaml_error):
-                with pytest.raises(ConfigFileError) as exc_info:
-                    load_config_file(config_path)
-                # Exception message should contain the error without redundant str()
-                assert "YAML syntax error" in str(exc_info.value)
-                assert config_path in str(exc_info.value)
+    # Mock YAML parsing error
+    yaml_error = yaml.YAMLError("YAML syntax error")
+    with patch("yaml.load", side_effect=yaml_error):
+        with pytest.raises(ConfigFileError) as exc_info:
+            load_config_file(str(config_path))
+        # Exception message should contain the error without redundant str()
+        assert "YAML syntax error" in str(exc_info.value)
+        assert str(config_path) in str(exc_info.value)
+
+
+def test_load_config_file_rejects_utf16(tmp_path):
+    """UTF-16 encoded files are rejected instead of being silently decoded."""
+    config_path = tmp_path / "utf16.yaml"
+    config_path.write_bytes("timeout: 30\n".encode("utf-16"))
+
+    with pytest.raises(ConfigFileError, match="must be UTF-8 encoded"):
+        load_config_file(str(config_path))
 
 
 def test_load_config_file_empty_file(tmp_path):
@@ -145,11 +153,68 @@ def test_load_config_file_output_dir_invalid_output_section(tmp_path, caplog):
     assert "must be a mapping" in caplog.text.lower()
 
 
-def test_load_config_file_unexpected_exception(tmp_path):
-    """Test that unexpected exceptions are wrapped in ConfigFileError."""
+def test_load_config_file_os_error(tmp_path):
+    """Test that OS-level read failures are wrapped in ConfigFileError."""
     config_path = tmp_path / "test.yaml"
     config_path.write_text("key: value")
 
-    with patch("builtins.open", side_effect=OSError("Unexpected error")):
-        with pytest.raises(ConfigFileError, match="Unexpected error"):
+    with patch("os.open", side_effect=OSError("Disk failure")):
+        with pytest.raises(ConfigFileError, match="Error reading.*Disk failure"):
             load_config_file(str(config_path))
+
+
+def test_load_config_file_prefers_libyaml_loader():
+    """The C-backed SafeLoader should be used whenever PyYAML provides it."""
+    from mcp_fuzzer.config import parser
+
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert parser._yaml_loader() is expected
+
+
+def test_load_config_file_reuses_parse_for_unchanged_file(tmp_path):
+    """An unchanged file is served from the parse cache as an independent copy."""
+    config_path = tmp_path / "cached.yaml"
+    config_path.write_text("output:\n  directory: reports\n")
+
+    first = load_config_file(str(config_path))
+    first["output"]["directory"] = "mutated"
+    with patch("yaml.load") as mock_load:
+        second = load_config_file(str(config_path))
+    mock_load.assert_not_called()
+    assert second == {"output": {"directory": "reports"}}
+
+
+def test_load_config_file_reparses_modified_file(tmp_path):
+    """A changed mtime or size invalidates the cached parse."""
+    config_path = tmp_path / "cached.yaml"
+    config_path.write_text("timeout: 30\n")
+    assert load_config_file(str(config_path)) == {"timeout": 30}
+
+    config_path.write_text("timeout: 45\n")
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config_file(str(config_path)) == {"timeout": 45}
+
+
+def test_load_config_file_wraps_malformed_yaml_scalar(tmp_path):
+    """Constructor errors for malformed scalars are reported as config errors."""
+    from mcp_fuzzer.config.loader import apply_config_file
+
+    config_path = tmp_path / "test.yaml"
+    config_path.write_text("started: 2024-13-45\n")
+
+    with pytest.raises(ConfigFileError, match="Error parsing YAML"):
+        load_config_file(str(config_path))
+    assert apply_config_file(config_path=str(config_path)) is False
+
+
+def test_load_config_file_cache_shared_across_path_spellings(tmp_path, monkeypatch):
+    """Relative and absolute paths to the same file reuse one parse."""
+    config_path = tmp_path / "shared.yaml"
+    config_path.write_text("timeout: 30\n")
+    monkeypatch.chdir(tmp_path)
+
+    load_config_file(str(config_path))
+    with patch("yaml.load") as mock_load:
+        assert load_config_file("shared.yaml") == {"timeout": 30}
+    mock_load.assert_not_called()
@@ -149,3 +149,35 @@ def test_schema_builders_are_independent():
     assert not set(timeout.keys()) & set(basic.keys())
     assert not set(timeout.keys()) & set(fuzzing.keys())
     assert not set(basic.keys()) & set(fuzzing.keys())
+
+
+def test_get_config_schema_returns_private_copies():
+    """Mutating a returned schema must not leak into later calls or validation."""
+    from mcp_fuzzer.config.schema_composer import get_config_validator
+
+    schema = get_config_schema()
+    schema["properties"]["timeout"]["type"] = "string"
+
+    assert get_config_schema()["properties"]["timeout"]["type"] == "number"
+    assert get_config_validator().is_valid({"timeout": 5})
+
+
+def test_schema_builder_results_are_not_shared():
+    """Mutating a builder's result must not leak into the composed schema."""
+    from mcp_fuzzer.config.schema_composer import get_config_validator
+
+    build_timeout_schema()["timeout"]["type"] = "string"
+
+    assert build_timeout_schema()["timeout"]["type"] == "number"
+    assert get_config_schema()["properties"]["timeout"]["type"] == "number"
+    assert get_config_validator().is_valid({"timeout": 5})
+
+
+def test_get_config_validator_is_compiled_once():
+    """The config validator is cached and checks against the shared schema."""
+    from mcp_fuzzer.config.schema_composer import get_config_validator
+
+    validator = get_config_validator()
+    assert validator is get_config_validator()
+    assert validator.is_valid({"timeout": 5})
+    assert not validator.is_valid({"timeout": "slow"})
@@ -223,3 +223,118 @@ async def test_execute_batch_empty_operations(executor):
     results = await executor.execute_batch([])
     assert len(results["results"]) == 0
     assert len(results["errors"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_pulls_operations_lazily(executor):
+    """Only max_concurrency operations are materialized ahead of completion."""
+    pulled = 0
+    completed = 0
+    ahead = []
+
+    async def op(value):
+        nonlocal completed
+        await asyncio.sleep(0.001 * (value % 3))
+        completed += 1
+        return value
+
+    def operations():
+        nonlocal pulled
+        for i in range(10):
+            pulled += 1
+            ahead.append(pulled - completed)
+            yield op, (i,), {}
+
+    results = await executor.execute_batch(operations())
+    assert results["results"] == list(range(10))
+    assert max(ahead) <= executor.max_concurrency
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_cancels_running_tasks_when_cancelled(executor):
+    """Cancelling the batch cancels operations still in flight."""
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_op():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    batch = asyncio.create_task(executor.execute_batch([(slow_op, [], {})]))
+    await started.wait()
+    batch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await batch
+    await asyncio.sleep(0)
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_cancelled_operation_aborts_siblings(executor):
+    """A cancelled operation aborts the batch without waiting for the rest."""
+    sibling_cancelled = asyncio.Event()
+
+    async def cancelled_op():
+        raise asyncio.CancelledError
+
+    async def slow_op():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    operations = [(slow_op, [], {}), (cancelled_op, [], {})]
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(executor.execute_batch(operations), timeout=1.0)
+    await asyncio.sleep(0)
+    assert sibling_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_stream_yields_in_completion_order(executor):
+    """Outcomes are yielded as they complete, tagged with their index."""
+    release = asyncio.Event()
+
+    async def slow_op():
+        await release.wait()
+        return "slow"
+
+    async def failing_op():
+        raise ValueError("boom")
+
+    operations = [(slow_op, [], {}), (lambda: "fast", [], {}), (failing_op, [], {})]
+    outcomes = []
+    async for index, ok, value in executor.execute_batch_stream(operations):
+        outcomes.append((index, ok, value))
+        if len(outcomes) == 2:
+            release.set()
+
+    assert [index for index, _, _ in outcomes[:2]] in ([1, 2], [2, 1])
+    assert outcomes[2] == (0, True, "slow")
+    failed = next(o for o in outcomes if o[0] == 2)
+    assert failed[1] is False and isinstance(failed[2], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_stream_close_cancels_running(executor):
+    """Closing the stream early cancels the operations still running."""
+    cancelled = []
+
+    async def slow_op():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    operations = [(lambda: "fast", [], {}), (slow_op, [], {}), (slow_op, [], {})]
+    stream = executor.execute_batch_stream(operations)
+    assert await stream.__anext__() == (0, True, "fast")
+    await stream.aclose()
+    await asyncio.sleep(0)
+    assert cancelled == [True, True]
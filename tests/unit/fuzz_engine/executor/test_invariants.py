@@ -3,6 +3,7 @@
 Unit tests for invariants module.
 """
 
+import asyncio
 import unittest
 import pytest
 from unittest.mock import patch
@@ -295,5 +296,61 @@ async def test_verify_batch_responses_some_invalid():
         assert mock_verify.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_verify_batch_responses_without_schema_stays_on_loop():
+    """Schema-less batches are checked inline instead of per-response threads."""
+    responses = [
+        {"jsonrpc": "2.0", "id": 1, "result": "success"},
+        {"jsonrpc": "2.0", "id": 2, "error": {"code": "bad", "message": "x"}},
+        None,
+    ]
+
+    with patch("asyncio.to_thread") as mock_to_thread:
+        results = await verify_batch_responses(responses)
+
+    mock_to_thread.assert_not_called()
+    assert results[0] is True
+    assert "integer" in results[1]
+    assert results[2] == "Response is None"
+
+
+@pytest.mark.asyncio
+async def test_verify_batch_responses_with_schema_uses_threads():
+    """Schema validation still runs off the event loop."""
+    responses = [{"jsonrpc": "2.0", "id": 1, "result": "success"}]
+    schema = {"type": "object"}
+
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+        results = await verify_batch_responses(responses, schema=schema)
+
+    assert mock_to_thread.call_count == 1
+    assert results == {0: True}
+
+
+def test_check_response_schema_conformity_reuses_checked_validator():
+    """The metaschema check runs once per schema, not once per response."""
+    from jsonschema import Draft202012Validator
+
+    from mcp_fuzzer.fuzz_engine.executor import invariants
+
+    schema = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "required": ["id"],
+    }
+    with patch.object(
+        Draft202012Validator,
+        "check_schema",
+        wraps=Draft202012Validator.check_schema,
+    ) as mock_check:
+        assert check_response_schema_conformity({"id": 1}, schema)
+        assert check_response_schema_conformity({"id": 2}, schema)
+        with pytest.raises(InvariantViolation, match="'id' is a required"):
+            check_response_schema_conformity({}, schema)
+
+    assert mock_check.call_count == 1
+    assert invariants._validators[id(schema)][0] is schema
+
+
 if __name__ == "__main__":
     unittest.main()
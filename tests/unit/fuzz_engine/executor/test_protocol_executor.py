@@ -196,11 +196,16 @@ async def test_execute_batch_validation_timeout(protocol_executor, mock_transpor
         assert any("timed out" in str(viol).lower() for viol in violations)
 
 
+async def _cancelled_stream(_operations):
+    raise asyncio.CancelledError
+    yield
+
+
 @pytest.mark.asyncio
 async def test_execute_cancelled_error(protocol_executor):
     """Test execution with cancelled error."""
     with patch.object(
-        protocol_executor.executor, "execute_batch", side_effect=asyncio.CancelledError
+        protocol_executor.executor, "execute_batch_stream", _cancelled_stream
     ):
         with pytest.raises(asyncio.CancelledError):
             await protocol_executor.execute("InitializeRequest", runs=1)
@@ -237,14 +242,33 @@ async def test_execute_returns_empty_for_missing_fuzzer_method(monkeypatch):
 async def test_execute_and_process_operations_cancelled(monkeypatch):
     executor = ProtocolExecutor()
     executor.executor = MagicMock()
-    executor.executor.execute_batch = AsyncMock(
-        return_value={"results": [], "errors": [asyncio.CancelledError()]}
-    )
+    executor.executor.execute_batch_stream = _cancelled_stream
 
     with pytest.raises(asyncio.CancelledError):
         await executor._execute_and_process_operations([], "PingRequest")
 
 
+@pytest.mark.asyncio
+async def test_execute_and_process_operations_orders_streamed_outcomes():
+    executor = ProtocolExecutor()
+
+    async def _stream(_operations):
+        yield 2, False, ValueError("late")
+        yield 1, True, {"run": 2}
+        yield 3, True, None
+        yield 0, True, {"run": 1}
+
+    executor.executor = MagicMock()
+    executor.executor.execute_batch_stream = _stream
+
+    results = await executor._execute_and_process_operations([], "PingRequest")
+
+    assert results[:2] == [{"run": 1}, {"run": 2}]
+    assert results[2]["run"] == -1
+    assert results[2]["exception"] == "late"
+    assert len(results) == 3
+
+
 @pytest.mark.asyncio
 async def test_execute_single_run_exception_path(monkeypatch):
     executor = ProtocolExecutor()
@@ -303,3 +327,190 @@ async def test_execute_batch_requests_handles_empty_and_exception(monkeypatch):
     results = await executor.execute_batch_requests(runs=2)
 
     assert results == [{"run": 1}]
+
+
+@pytest.mark.asyncio
+async def test_execute_resolves_fuzzer_method_once_per_call():
+    mutator = ProtocolMutator()
+    executor = ProtocolExecutor(mutator=mutator)
+    with (
+        patch.object(ProtocolMutator, "_seed_ratio_for_phase", return_value=0.0),
+        patch.object(
+            mutator, "get_fuzzer_method", wraps=mutator.get_fuzzer_method
+        ) as lookup,
+    ):
+        results = await executor.execute(
+            "PingRequest", runs=4, phase="realistic", generate_only=True
+        )
+    assert len(results) == 4
+    assert lookup.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_all_types_keeps_type_order(monkeypatch):
+    executor = ProtocolExecutor()
+    monkeypatch.setattr(executor, "PROTOCOL_TYPES", ("A", "B", "C"))
+    delays = {"A": 0.02, "B": 0.01, "C": 0.0}
+
+    async def fake_single_type(protocol_type, runs, phase):
+        await asyncio.sleep(delays[protocol_type])
+        return [{"protocol_type": protocol_type}]
+
+    monkeypatch.setattr(executor, "_execute_single_type", fake_single_type)
+    result = await executor.execute_all_types(runs_per_type=1)
+    assert list(result) == ["A", "B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_execute_all_types_runs_bounded_worker_pool(monkeypatch):
+    executor = ProtocolExecutor(max_concurrency=2)
+    monkeypatch.setattr(executor, "PROTOCOL_TYPES", ("A", "B", "C", "D", "E"))
+    in_flight = 0
+    peak = 0
+
+    async def fake_single_type(protocol_type, runs, phase):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return []
+
+    monkeypatch.setattr(executor, "_execute_single_type", fake_single_type)
+    result = await executor.execute_all_types(runs_per_type=1)
+    assert list(result) == ["A", "B", "C", "D", "E"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_single_type_logs_summary_counts(monkeypatch):
+    executor = ProtocolExecutor()
+    results = [
+        {"success": True},
+        {"success": False, "server_rejected_input": True},
+        {"success": False},
+    ]
+    monkeypatch.setattr(executor, "execute", AsyncMock(return_value=results))
+    executor._logger = MagicMock()
+
+    assert await executor._execute_single_type("PingRequest", 3, "aggressive") is (
+        results
+    )
+    executor._logger.info.assert_called_with(
+        "Completed %s: %d/%d successful, %d server rejections",
+        "PingRequest",
+        1,
+        3,
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_all_types_timeout_cancels_in_flight_runs(monkeypatch):
+    executor = ProtocolExecutor(max_concurrency=2)
+    monkeypatch.setattr(executor, "PROTOCOL_TYPES", ("PingRequest",))
+    monkeypatch.setattr(executor, "TYPE_TIMEOUT", 0.05)
+    started = 0
+    cancelled = 0
+
+    async def hanging_run(*_args, **_kwargs):
+        nonlocal started, cancelled
+        started += 1
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    monkeypatch.setattr(executor, "_execute_single_run", hanging_run)
+    result = await executor.execute_all_types(runs_per_type=5)
+
+    assert result == {"PingRequest": []}
+    # Only the runs holding a slot were started, and all of them were cancelled
+    assert started == 2
+    assert cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_all_types_logs_failure_before_slow_types_finish(monkeypatch):
+    executor = ProtocolExecutor(max_concurrency=2)
+    monkeypatch.setattr(executor, "PROTOCOL_TYPES", ("Slow", "Broken"))
+    executor._logger = MagicMock()
+    logged_while_slow_running = []
+
+    async def fake_single_type(protocol_type, runs, phase):
+        if protocol_type == "Broken":
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.01)
+        logged_while_slow_running.append(executor._logger.error.called)
+        return [{"success": True}]
+
+    monkeypatch.setattr(executor, "_execute_single_type", fake_single_type)
+    result = await executor.execute_all_types(runs_per_type=1)
+
+    assert result == {"Slow": [{"success": True}], "Broken": []}
+    assert logged_while_slow_running == [True]
+
+
+@pytest.mark.asyncio
+async def test_execute_single_run_without_transport_skips_send(monkeypatch):
+    executor = ProtocolExecutor(transport=None)
+    executor.mutator.mutate = AsyncMock(return_value={"method": "ping"})
+    executor._send_fuzzed_request = AsyncMock()
+
+    result = await executor._execute_single_run("PingRequest", 0, "aggressive")
+
+    executor._send_fuzzed_request.assert_not_awaited()
+    assert result["success"] is True
+    assert result["server_response"] is None
+    assert result["server_rejected_input"] is False
+    assert result["spec_checks"] == []
+
+
+@pytest.mark.asyncio
+async def test_execute_dedupe_drops_repeated_payloads():
+    executor = ProtocolExecutor(max_concurrency=2)
+    executor.mutator.get_fuzzer_method = MagicMock(return_value=lambda: None)
+    executor.mutator.mutate = AsyncMock(return_value={"method": "ping", "id": 1})
+
+    assert len(await executor.execute("PingRequest", runs=4)) == 4
+
+    executor.mutator.mutate.reset_mock()
+    results = await executor.execute("PingRequest", runs=4, dedupe=True)
+
+    assert [r["fuzz_data"] for r in results] == [{"id": 1, "method": "ping"}]
+    # The first run generates once; each duplicate retries DEDUPE_ATTEMPTS times
+    expected_calls = 1 + 3 * (1 + ProtocolExecutor.DEDUPE_ATTEMPTS)
+    assert executor.mutator.mutate.await_count == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_execute_dedupe_regenerates_until_payload_is_new():
+    executor = ProtocolExecutor(max_concurrency=1)
+    executor.mutator.get_fuzzer_method = MagicMock(return_value=lambda: None)
+    executor.mutator.mutate = AsyncMock(side_effect=[{"id": 1}, {"id": 1}, {"id": 2}])
+
+    results = await executor.execute("PingRequest", runs=2, dedupe=True)
+
+    assert [r["fuzz_data"] for r in results] == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_execute_dedupe_keeps_unserializable_payloads():
+    executor = ProtocolExecutor(max_concurrency=1)
+    executor.mutator.get_fuzzer_method = MagicMock(return_value=lambda: None)
+    payloads = [{1: "x", "a": "y"}, {(1, 2): "t"}]
+    executor.mutator.mutate = AsyncMock(side_effect=payloads)
+
+    results = await executor.execute("PingRequest", runs=2, dedupe=True)
+
+    assert [r["fuzz_data"] for r in results] == payloads
+    assert all(r["success"] for r in results)
+
+
+def test_payload_digest_is_fixed_size():
+    big = {"params": {"value": "A" * 100000}}
+    assert len(ProtocolExecutor._payload_digest(big)) == 16
+    assert ProtocolExecutor._payload_digest(big) != ProtocolExecutor._payload_digest(
+        {"params": {"value": "B" * 100000}}
+    )
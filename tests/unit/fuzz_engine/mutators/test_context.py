@@ -52,3 +52,24 @@ def test_ensure_context_overrides_existing():
     assert ctx.schema == {"field": "value"}
     assert ctx.havoc_mode is True
     assert ctx.run_index == 5
+
+
+def test_with_defaults_returns_complete_context_unchanged():
+    ctx = FuzzerContext(rng=random.Random(3), run_index=7)
+
+    assert ctx.with_defaults() is ctx
+
+
+def test_ensure_context_inherits_unset_fields():
+    rng = random.Random(4)
+    base = FuzzerContext(
+        phase="realistic", run_index=9, rng=rng, havoc_mode=True, havoc_max=8
+    )
+
+    ctx = ensure_context(base, phase=None)
+
+    assert ctx.phase == "realistic"
+    assert ctx.rng is rng
+    assert ctx.run_index == 9
+    assert ctx.havoc_mode is True
+    assert ctx.havoc_max == 8
@@ -223,3 +223,31 @@ def test_protocol_signature_variants():
         == "spec:rule-a"
     )
     assert protocol_mutator_module._protocol_signature(None, None) is None
+
+
+@pytest.mark.asyncio
+async def test_mutate_reads_phase_signature_once_per_code_object(protocol_mutator):
+    """Fresh closures from one factory reuse the cached phase check."""
+
+    def factory():
+        def method(phase="aggressive"):
+            return {"phase": phase}
+
+        return method
+
+    with (
+        patch.object(
+            protocol_mutator.strategies,
+            "get_protocol_fuzzer_method",
+            side_effect=lambda *_args, **_kwargs: factory(),
+        ),
+        patch.object(
+            protocol_mutator_module.inspect,
+            "signature",
+            wraps=inspect.signature,
+        ) as signature,
+    ):
+        for _ in range(3):
+            result = await protocol_mutator.mutate("TestType", phase="realistic")
+            assert result == {"phase": "realistic"}
+    assert signature.call_count == 1
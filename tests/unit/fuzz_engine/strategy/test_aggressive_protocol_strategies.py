@@ -2,9 +2,14 @@
 Unit tests for aggressive protocol type strategies.
 """
 
+import random
+
 import pytest
+from mcp_fuzzer.fuzz_engine.mutators.rng_context import fuzz_rng_scope
 from mcp_fuzzer.fuzz_engine.mutators.strategies.aggressive_protocol_type_strategy import (  # noqa: E501
+    _ATOMIC_STRING_POOL,
     generate_malicious_string,
+    generate_malicious_strings,
     generate_malicious_value,
     choice_lazy,
     generate_experimental_payload,
@@ -79,6 +84,13 @@ class TestAggressiveHelperFunctions:
         assert all(isinstance(s, str) for s in strings)
         assert len(set(strings)) > 1, "Should generate different malicious strings"
 
+    def test_generate_malicious_strings(self):
+        """Test batch generation draws from the fixed payload pool."""
+        strings = generate_malicious_strings(50)
+        assert len(strings) == 50
+        assert all(s in _ATOMIC_STRING_POOL for s in strings)
+        assert generate_malicious_strings(0) == []
+
     def test_generate_malicious_value(self):
         """Test malicious value generation."""
         values = [generate_malicious_value() for _ in range(100)]
@@ -93,6 +105,31 @@ class TestAggressiveHelperFunctions:
             "Should include collection values"
         )
 
+    def test_generate_malicious_value_returns_fresh_containers(self):
+        """Mutating a returned container must not leak into later picks."""
+        for _ in range(300):
+            value = generate_malicious_value()
+            if isinstance(value, dict):
+                value["polluted"] = True
+            elif isinstance(value, list):
+                value.append("polluted")
+        for _ in range(300):
+            value = generate_malicious_value()
+            if isinstance(value, (dict, list)):
+                assert "polluted" not in value
+
+    def test_malicious_generators_follow_scoped_rng(self):
+        """Generators draw from the active fuzz RNG, so a seed reproduces them."""
+
+        def _draw(seed):
+            with fuzz_rng_scope(random.Random(seed)):
+                return [
+                    (generate_malicious_string(), repr(generate_malicious_value()))
+                    for _ in range(20)
+                ]
+
+        assert _draw(7) == _draw(7)
+
     def test_choice_lazy(self):
         """Test choice_lazy handles callable and non-callable options."""
         # Non-callable options
@@ -132,3 +169,14 @@ class TestAggressiveHelperFunctions:
         
         types = {type(p) for p in payloads}
         assert len(types) > 1, "Should generate different experimental payload types"
+
+    def test_generate_experimental_payload_cadence_across_threads(self):
+        """Every fifth call returns None even when callers race."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            payloads = list(
+                pool.map(lambda _: generate_experimental_payload(), range(1000))
+            )
+        # Exactly 200 calls hit the None cadence; options can add more
+        assert sum(p is None for p in payloads) >= 200
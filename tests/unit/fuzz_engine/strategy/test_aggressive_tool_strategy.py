@@ -702,3 +702,16 @@ def test_fuzz_tool_arguments_aggressive_string_schema_fallback(monkeypatch):
     assert args["b"] == 7
     assert args["c"] == "text"
     assert set(args.keys()).issubset({"a", "b", "c"})
+
+
+def test_match_hint_keeps_group_order_and_caches():
+    tool_strategy._match_hint.cache_clear()
+    # "file_url" matches both ssrf and path; the earlier group wins
+    assert tool_strategy._match_hint("file_URL", "text") == "ssrf"
+    assert tool_strategy._match_hint("mongoFilter", "text") == "sql"
+    assert tool_strategy._match_hint("mongo_db", "text") == "nosql"
+    assert tool_strategy._match_hint("link", "semantic_string") is None
+    assert tool_strategy._match_hint("maxItems", "semantic_number") == "max"
+
+    tool_strategy._match_hint("file_URL", "text")
+    assert tool_strategy._match_hint.cache_info().hits == 1
@@ -206,6 +206,26 @@ class TestDefinitionFor:
             result = _definition_for("Test", None)
             assert result is None
 
+    def test_definition_resolved_once_per_schema(self):
+        """Resolved definitions are reused until the schema changes."""
+        schema = {
+            "definitions": {
+                "Test": {"properties": {"params": {"$ref": "#/definitions/P"}}},
+                "P": {"type": "object"},
+            }
+        }
+        patch_path = (
+            "mcp_fuzzer.fuzz_engine.mutators.strategies.spec_protocol._load_schema"
+        )
+        with patch(patch_path, return_value=schema):
+            first = _definition_for("Test", None)
+            assert first["properties"]["params"] == {"type": "object"}
+            assert _definition_for("Test", None) is first
+
+        other = {"definitions": {"Test": {"type": "object"}}}
+        with patch(patch_path, return_value=other):
+            assert _definition_for("Test", None) == {"type": "object"}
+
 
 class TestGenerateParams:
     """Test cases for _generate_params."""
@@ -9,6 +9,7 @@ import io
 import json
 import random
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -49,11 +50,11 @@ def _restore_config_mediator():
 
     from mcp_fuzzer.config import config_mediator
 
-    snapshot = copy.deepcopy(config_mediator._config._config)
+    snapshot = copy.deepcopy(dict(config_mediator._config.snapshot()))
     try:
         yield
     finally:
-        config_mediator._config._config = snapshot
+        config_mediator._config._config = MappingProxyType(snapshot)
 
 
 @pytest.mark.asyncio
@@ -829,10 +830,10 @@ def test_fail_if_no_tools_flag_parses_and_merges():
 
     import copy
 
-    snapshot = copy.deepcopy(config_mediator._config._config)
+    snapshot = copy.deepcopy(dict(config_mediator._config.snapshot()))
     try:
         cfg = build_cli_config(args)
         assert cfg.merged["fail_if_no_tools"] is True
     finally:
-        config_mediator._config._config = snapshot
+        config_mediator._config._config = MappingProxyType(snapshot)
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Unit tests for corpus helpers."""
 
+from hashlib import sha256
 from pathlib import Path
 
 import pytest
@@ -16,6 +17,13 @@ def test_build_target_id_deterministic():
     assert target_a == target_b
 
 
+def test_build_target_id_matches_existing_corpus_layout():
+    """Target ids name on-disk corpus directories, so their format is fixed."""
+    raw = "http::http://localhost:8000/mcp"
+    expected = "http-" + sha256(raw.encode("utf-8")).hexdigest()[:16]
+    assert build_target_id("HTTP", "http://LOCALHOST:8000/mcp") == expected
+
+
 def test_build_corpus_root(tmp_path: Path):
     root = build_corpus_root(tmp_path, "http-abc123")
     assert root == tmp_path / "corpus" / "http-abc123"
@@ -25,3 +33,12 @@ def test_build_corpus_root_default_fs_root(monkeypatch, tmp_path: Path):
     monkeypatch.setenv("MCP_FUZZER_FS_ROOT", str(tmp_path))
     root = build_corpus_root(None, "stdio-deadbeef")
     assert root == tmp_path / "corpus" / "stdio-deadbeef"
+
+
+def test_build_corpus_root_default_follows_env_changes(monkeypatch, tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    monkeypatch.setenv("MCP_FUZZER_FS_ROOT", str(first))
+    assert build_corpus_root(None, "t") == first / "corpus" / "t"
+    monkeypatch.setenv("MCP_FUZZER_FS_ROOT", str(second))
+    assert build_corpus_root("", "t") == second / "corpus" / "t"
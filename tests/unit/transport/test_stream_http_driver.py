@@ -1224,3 +1224,20 @@ async def test_terminate_session_wraps_http_errors(monkeypatch):
 
     with pytest.raises(TransportError):
         await driver.terminate_session()
+
+
+def test_retry_backoff_uses_retry_policy(monkeypatch):
+    from mcp_fuzzer.transport.drivers import stream_http_driver
+    from mcp_fuzzer.transport.retrying import RetryPolicy
+    from mcp_fuzzer.types import RETRY_DELAY
+
+    policy = stream_http_driver._RETRY_POLICY
+    assert policy.base_delay == RETRY_DELAY
+    assert policy.max_delay == RetryPolicy().max_delay
+
+    monkeypatch.setattr(
+        "mcp_fuzzer.transport.retrying.random.uniform", lambda _a, _b: 0.0
+    )
+    assert policy.delay_for(1) == RETRY_DELAY
+    assert policy.delay_for(3) == RETRY_DELAY * 4
+    assert policy.delay_for(30) == policy.max_delay